@@ -22,15 +22,37 @@ class Graph:
         self.is_directed = is_directed
 
 
+class WeightedGraph:
+    """
+    Same adjacency model as `Graph` where the neighbors of every node map to the weight of the edge to them
+    For undirected graphs, every edge is present in both directions with the same weight
+    """
+    def __init__(self, graph: Dict[str, Dict[str, float]], is_directed: bool = False):
+        self.graph = graph
+        self.is_directed = is_directed
+
+
 # ----- Utilities -----
 
-def print_graph(graph: Union[Graph, Dict[str, Set]], message: str) -> None:
-    if isinstance(graph, Graph):
+def print_graph(graph: Union[Graph, WeightedGraph, Dict[str, Set], Dict[str, Dict[str, float]]], message: str) -> None:
+    if isinstance(graph, (Graph, WeightedGraph)):
         graph = graph.graph
     print(message)
     pprint(graph)
 
 
+def reverse_graph(graph: Dict[str, Set]) -> Dict[str, Set]:
+    """
+    Get the adjacency of the graph with all edges reversed (transpose graph)
+    Reversing an undirected graph gives back the same adjacency
+    """
+    reversed_graph: Dict[str, Set] = {node: set() for node in graph}
+    for node, nbrs in graph.items():
+        for nbr in nbrs:
+            reversed_graph.setdefault(nbr, set()).add(node)
+    return reversed_graph
+
+
 def visualize_graph(graph: Graph) -> None:
     _graph = graph.is_directed and nx.DiGraph(graph.graph) or nx.Graph(graph.graph)
     nx.draw_networkx(_graph, with_labels=True, node_color="c", edge_color="k", font_size=10)
@@ -143,3 +165,28 @@ class SampleGraphs:
             'H': set()
         }
         return Graph(graph=_graph, is_directed=True)
+
+    @staticmethod
+    def weighted_undirected_conn_graph() -> WeightedGraph:
+        _graph = {
+            'A': {'B': 4.0, 'C': 1.0},
+            'B': {'A': 4.0, 'C': 2.0, 'D': 5.0},
+            'C': {'A': 1.0, 'B': 2.0, 'D': 8.0, 'E': 10.0},
+            'D': {'B': 5.0, 'C': 8.0, 'E': 2.0, 'F': 6.0},
+            'E': {'C': 10.0, 'D': 2.0, 'F': 3.0},
+            'F': {'D': 6.0, 'E': 3.0}
+        }
+        return WeightedGraph(graph=_graph, is_directed=False)
+
+    @staticmethod
+    def weighted_directed_disconn_graph() -> WeightedGraph:
+        _graph = {
+            'A': {'B': 4.0, 'C': 1.0},
+            'B': {'D': 1.0},
+            'C': {'B': 2.0, 'D': 5.0},
+            'D': {'E': 3.0},
+            'E': {},
+            'F': {'G': 1.0},
+            'G': {}
+        }
+        return WeightedGraph(graph=_graph, is_directed=True)
@@ -0,0 +1,264 @@
+import argparse
+import contextlib
+import json
+import math
+import multiprocessing
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from graph import Graph, reverse_graph
+from graph.biconnected_components import biconnectivity, csr_biconnectivity
+from graph.connected_components import (conn_comps_parallel, conn_comps_streaming_union_find,
+                                        conn_comps_undirected_union_find, conn_comps_using_bfs, conn_comps_using_dfs,
+                                        conn_comps_using_dfs_iterative)
+from graph.csr import CSRGraph, csr_bfs, csr_dfs
+from graph.cycles import (enumerate_cycles_directed, find_cycles_directed_dfs, find_cycles_directed_dfs_iterative,
+                          find_cycles_undirected_dfs, find_cycles_undirected_dfs_iterative,
+                          find_cycles_undirected_union_find, find_cycles_undirected_using_edge_count,
+                          find_shortest_cycle_directed, find_shortest_cycle_undirected)
+from graph.direction_optimizing_bfs import bfs_direction_optimizing
+from graph.generators import (chain_graph, complete_graph, erdos_renyi_graph, grid_graph,
+                              preferential_attachment_graph, random_dag)
+from graph.paths import (bfs_paths, bfs_paths_bidirectional, bfs_paths_optimized, bfs_paths_parent_pointers,
+                         dfs_paths, dfs_paths_parent_pointers)
+from graph.reachability import ReachabilityIndex
+from graph.strongly_connected_components import condensation, scc_kosaraju, scc_tarjan
+from graph.topological_sorting import top_sort_bfs, top_sort_bfs_levels, top_sort_dfs, top_sort_dfs_iterative
+from graph.traversals import (bfs_iterative, bfs_iterative_optimized, bfs_lazy, dfs_explicit_stack, dfs_iterative,
+                              dfs_lazy, dfs_recursive)
+from graph.valid_tree import (graph_valid_tree_directed_using_dfs, graph_valid_tree_directed_using_dfs_iterative,
+                              graph_valid_tree_undirected_using_dfs, graph_valid_tree_undirected_using_dfs_iterative,
+                              graph_valid_tree_undirected_using_num_edges,
+                              graph_valid_tree_undirected_using_num_edges_iterative)
+
+try:
+    import resource
+except ImportError:  # not available on Windows, peak RSS is reported as null
+    resource = None  # type: ignore
+
+"""
+Benchmark harness for the graph algorithms on synthetic graphs of increasing size
+
+Every (generator, size, algorithm) case runs in a fresh worker process, so that the peak resident set size (RSS) of a
+case is not inflated by the previous ones:
+1. the graph is generated (seeded, so every run benchmarks the same graphs) and the peak RSS is recorded
+2. any algorithm specific preparation is done (eg: conversion to `CSRGraph`), outside of the timings
+3. the algorithm runs `repeat` times and the fastest run is reported, then the peak RSS is recorded again
+Cases running longer than a timeout are killed and reported with the error "Timeout".
+
+Results are written as JSON lines, one record per case, for regression tracking:
+    {"generator", "size", "nodes", "edges", "algorithm", "seconds", "nodes_per_sec", "edges_per_sec",
+     "graph_peak_rss_kb", "peak_rss_kb", "error"}
+where edges counts adjacency entries (undirected edges twice) and error is set (eg: "RecursionError") instead of the
+timings if the algorithm failed. Algorithms only run on the kinds of graphs they support (undirected, directed, DAG);
+path algorithms look for a path from the first to the last node, and anything printed by an algorithm goes to stderr.
+
+Not benchmarked: the query structures (`PathQueryEngine`, `DynamicTopoOrder`), whose cost depends on a query or update
+workload rather than a single run, `conn_comps_edge_file_union_find`, which is `conn_comps_streaming_union_find` over an
+edge list file, and the weighted graph algorithms (shortest paths, minimum spanning trees), as the generated graphs are
+not weighted.
+
+Usage: python -m graph.benchmark --sizes 1000 100000 --generators chain grid --output results.jsonl
+"""
+
+UNDIRECTED, DIRECTED, DAG = 'undirected', 'directed', 'dag'
+
+# name -> (kind of graph, generator of a graph with about `size` nodes from (size, seed))
+GENERATORS: Dict[str, Tuple[str, Callable[[int, int], Graph]]] = {
+    'erdos_renyi': (UNDIRECTED, lambda size, seed: erdos_renyi_graph(size, min(1.0, 8 / size), seed=seed)),
+    'erdos_renyi_directed': (DIRECTED, lambda size, seed: erdos_renyi_graph(size, min(1.0, 4 / size),
+                                                                            is_directed=True, seed=seed)),
+    'preferential_attachment': (UNDIRECTED, lambda size, seed: preferential_attachment_graph(size, 4, seed=seed)),
+    'random_dag': (DAG, lambda size, seed: random_dag(size, min(1.0, 8 / size), seed=seed)),
+    'chain': (DAG, lambda size, seed: chain_graph(size)),
+    'grid': (UNDIRECTED, lambda size, seed: grid_graph(int(math.sqrt(size)), int(math.sqrt(size)))),
+    # complete graphs have n^2 edges, so they are generated with about `size` edges instead of `size` nodes
+    'complete': (UNDIRECTED, lambda size, seed: complete_graph(max(2, int(math.sqrt(size))))),
+}
+
+START_NODE = '0'  # every generator labels nodes '0' to 'n-1'
+ENUMERATED_CYCLES = 1000  # cycles enumerated by Johnson's algorithm, as graphs can have exponentially many cycles
+
+
+def _as_graph(graph: Graph) -> Any:
+    return graph.graph
+
+
+def _as_csr(graph: Graph) -> Any:
+    return CSRGraph.from_graph(graph)
+
+
+def _as_edges(graph: Graph) -> Any:
+    return [(node, nbr) for node, nbrs in graph.graph.items() for nbr in nbrs]
+
+
+def _with_reversed(graph: Graph) -> Any:
+    return graph.graph, reverse_graph(graph.graph) if graph.is_directed else graph.graph
+
+
+def _goal_node(graph: Any) -> str:
+    return str(len(graph) - 1)
+
+
+def _consume(items) -> None:
+    for _ in items:
+        pass
+
+
+# name -> (kinds of graphs supported, preparation outside of the timings, algorithm run on the prepared graph)
+ALGORITHMS: Dict[str, Tuple[Tuple[str, ...], Callable[[Graph], Any], Callable[[Any], Any]]] = {
+    'dfs_recursive': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: dfs_recursive(g, START_NODE, set())),
+    'dfs_iterative': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: dfs_iterative(g, START_NODE)),
+    'dfs_explicit_stack': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: dfs_explicit_stack(g, START_NODE, set())),
+    'dfs_lazy': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: _consume(dfs_lazy(g, START_NODE))),
+    'bfs_iterative': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: bfs_iterative(g, START_NODE)),
+    'bfs_iterative_optimized': ((UNDIRECTED, DIRECTED, DAG), _as_graph,
+                                lambda g: bfs_iterative_optimized(g, START_NODE)),
+    'bfs_lazy': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: _consume(bfs_lazy(g, START_NODE))),
+    'csr_dfs': ((UNDIRECTED, DIRECTED, DAG), _as_csr, lambda g: csr_dfs(g, START_NODE)),
+    'csr_bfs': ((UNDIRECTED, DIRECTED, DAG), _as_csr, lambda g: csr_bfs(g, START_NODE)),
+    'bfs_direction_optimizing': ((UNDIRECTED, DIRECTED, DAG), _as_csr,
+                                 lambda g: bfs_direction_optimizing(g, START_NODE)),
+    'dfs_paths': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: dfs_paths(g, START_NODE, _goal_node(g))),
+    'bfs_paths': ((UNDIRECTED, DIRECTED, DAG), _as_graph, lambda g: bfs_paths(g, START_NODE, _goal_node(g))),
+    'bfs_paths_optimized': ((UNDIRECTED, DIRECTED, DAG), _as_graph,
+                            lambda g: bfs_paths_optimized(g, START_NODE, _goal_node(g))),
+    'dfs_paths_parent_pointers': ((UNDIRECTED, DIRECTED, DAG), _as_graph,
+                                  lambda g: dfs_paths_parent_pointers(g, START_NODE, _goal_node(g))),
+    'bfs_paths_parent_pointers': ((UNDIRECTED, DIRECTED, DAG), _as_graph,
+                                  lambda g: bfs_paths_parent_pointers(g, START_NODE, _goal_node(g))),
+    'bfs_paths_bidirectional': ((UNDIRECTED, DIRECTED, DAG), _with_reversed,
+                                lambda g: bfs_paths_bidirectional(g[0], START_NODE, _goal_node(g[0]),
+                                                                  reversed_graph=g[1])),
+    'conn_comps_using_dfs': ((UNDIRECTED,), _as_graph, conn_comps_using_dfs),
+    'conn_comps_using_bfs': ((UNDIRECTED,), _as_graph, conn_comps_using_bfs),
+    'conn_comps_using_dfs_iterative': ((UNDIRECTED,), _as_graph, conn_comps_using_dfs_iterative),
+    'conn_comps_undirected_union_find': ((UNDIRECTED,), _as_graph, conn_comps_undirected_union_find),
+    'conn_comps_streaming_union_find': ((UNDIRECTED,), _as_edges, conn_comps_streaming_union_find),
+    'conn_comps_parallel': ((UNDIRECTED,), _as_csr, conn_comps_parallel),
+    'biconnectivity': ((UNDIRECTED,), _as_graph, biconnectivity),
+    'csr_biconnectivity': ((UNDIRECTED,), _as_csr, csr_biconnectivity),
+    'find_cycles_undirected_using_edge_count': ((UNDIRECTED,), _as_graph, find_cycles_undirected_using_edge_count),
+    'find_cycles_undirected_dfs': ((UNDIRECTED,), _as_graph, find_cycles_undirected_dfs),
+    'find_cycles_undirected_dfs_iterative': ((UNDIRECTED,), _as_graph, find_cycles_undirected_dfs_iterative),
+    'find_cycles_undirected_union_find': ((UNDIRECTED,), _as_graph, find_cycles_undirected_union_find),
+    'find_cycles_directed_dfs': ((DIRECTED, DAG), _as_graph, find_cycles_directed_dfs),
+    'find_cycles_directed_dfs_iterative': ((DIRECTED, DAG), _as_graph, find_cycles_directed_dfs_iterative),
+    'find_shortest_cycle_undirected': ((UNDIRECTED,), _as_graph, find_shortest_cycle_undirected),
+    'find_shortest_cycle_directed': ((DIRECTED, DAG), _as_graph, find_shortest_cycle_directed),
+    'enumerate_cycles_directed': ((DIRECTED, DAG), _as_graph,
+                                  lambda g: _consume(enumerate_cycles_directed(g, limit=ENUMERATED_CYCLES))),
+    'top_sort_dfs': ((DAG,), _as_graph, top_sort_dfs),
+    'top_sort_dfs_iterative': ((DAG,), _as_graph, top_sort_dfs_iterative),
+    'top_sort_bfs': ((DAG,), _as_graph, top_sort_bfs),
+    'top_sort_bfs_levels': ((DAG,), _as_graph, top_sort_bfs_levels),
+    'top_sort_bfs_levels_csr': ((DAG,), lambda graph: CSRGraph.from_graph(graph), top_sort_bfs_levels),
+    'scc_tarjan': ((DIRECTED, DAG), _as_graph, scc_tarjan),
+    'scc_kosaraju': ((DIRECTED, DAG), _as_graph, scc_kosaraju),
+    'condensation': ((DIRECTED, DAG), _as_graph, condensation),
+    'reachability_index': ((DIRECTED, DAG), _as_graph, ReachabilityIndex),
+    'graph_valid_tree_undirected_using_num_edges': ((UNDIRECTED,), _as_graph,
+                                                    graph_valid_tree_undirected_using_num_edges),
+    'graph_valid_tree_undirected_using_num_edges_iterative': ((UNDIRECTED,), _as_graph,
+                                                              graph_valid_tree_undirected_using_num_edges_iterative),
+    'graph_valid_tree_undirected_using_dfs': ((UNDIRECTED,), _as_graph, graph_valid_tree_undirected_using_dfs),
+    'graph_valid_tree_undirected_using_dfs_iterative': ((UNDIRECTED,), _as_graph,
+                                                        graph_valid_tree_undirected_using_dfs_iterative),
+    'graph_valid_tree_directed_using_dfs': ((DIRECTED, DAG), _as_graph, graph_valid_tree_directed_using_dfs),
+    'graph_valid_tree_directed_using_dfs_iterative': ((DIRECTED, DAG), _as_graph,
+                                                      graph_valid_tree_directed_using_dfs_iterative),
+}
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # bytes on macOS, kilobytes on Linux
+
+
+def run_case(generator: str, size: int, algorithm: str, seed: int = 0, repeat: int = 1) -> Dict[str, Any]:
+    """
+    Generate a graph, run one algorithm on it and return the benchmark record (see module docstring)
+    """
+    _, generate = GENERATORS[generator]
+    _, prepare, run = ALGORITHMS[algorithm]
+    graph = generate(size, seed)
+    num_nodes, num_edges = len(graph.graph), sum(len(nbrs) for nbrs in graph.graph.values())
+    record: Dict[str, Any] = {
+        'generator': generator, 'size': size, 'nodes': num_nodes, 'edges': num_edges, 'algorithm': algorithm,
+        'seconds': None, 'nodes_per_sec': None, 'edges_per_sec': None,
+        'graph_peak_rss_kb': _peak_rss_kb(), 'peak_rss_kb': None, 'error': None,
+    }
+
+    prepared = prepare(graph)
+    try:
+        best = float('inf')
+        with contextlib.redirect_stdout(sys.stderr):  # keep messages of the algorithms out of the JSON lines output
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run(prepared)
+                best = min(best, time.perf_counter() - start)
+    except (RecursionError, MemoryError, ValueError) as e:  # ValueError: eg: too many components for the index
+        record['error'] = type(e).__name__
+    else:
+        record['seconds'] = best
+        record['nodes_per_sec'] = num_nodes / best if best > 0 else None
+        record['edges_per_sec'] = num_edges / best if best > 0 else None
+    record['peak_rss_kb'] = _peak_rss_kb()
+    return record
+
+
+def run_benchmarks(sizes: List[int], generators: List[str], algorithms: List[str], seed: int = 0, repeat: int = 1,
+                   isolate: bool = True, timeout: Optional[float] = 60.0) -> List[Dict[str, Any]]:
+    """
+    Run every supported (generator, size, algorithm) case and return the records
+    With isolate=True, every case runs in a fresh process which is killed after `timeout` seconds (error "Timeout"),
+    as some algorithms are super-linear on some graphs (eg: `bfs_iterative` enqueues a node once per path reaching it
+    on grids); otherwise cases run in this process without a timeout and peak RSS values are cumulative
+    """
+    cases = [(generator, size, algorithm, seed, repeat)
+             for generator in generators for size in sizes for algorithm in algorithms
+             if GENERATORS[generator][0] in ALGORITHMS[algorithm][0]]
+    records = []
+    for case in cases:
+        if isolate:
+            with multiprocessing.Pool(processes=1) as pool:  # terminates the worker on exit
+                try:
+                    record = pool.apply_async(run_case, case).get(timeout)
+                except multiprocessing.TimeoutError:
+                    generator, size, algorithm, _, _ = case
+                    record = {'generator': generator, 'size': size, 'nodes': None, 'edges': None,
+                              'algorithm': algorithm, 'seconds': None, 'nodes_per_sec': None, 'edges_per_sec': None,
+                              'graph_peak_rss_kb': None, 'peak_rss_kb': None, 'error': 'Timeout'}
+        else:
+            record = run_case(*case)
+        print("-> {generator:<24} {size:>9} {algorithm:<38} {result}".format(
+            result=record['error'] or "{:.4f}s".format(record['seconds']), **record), file=sys.stderr)
+        records.append(record)
+    return records
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark graph algorithms on synthetic graphs")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="approximate number of nodes of the generated graphs")
+    parser.add_argument('--generators', nargs='+', choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument('--algorithms', nargs='+', choices=sorted(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help="runs per case, the fastest one is reported")
+    parser.add_argument('--timeout', type=float, default=60.0, help="seconds per case before it is killed")
+    parser.add_argument('--no-isolate', action='store_true', help="run all cases in this process, without timeouts")
+    parser.add_argument('--output', help="JSON lines output file (default: stdout)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.generators, args.algorithms, seed=args.seed, repeat=args.repeat,
+                             isolate=not args.no_isolate, timeout=args.timeout)
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for result in results:
+            output.write(json.dumps(result) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
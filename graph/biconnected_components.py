@@ -0,0 +1,182 @@
+from array import array
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from graph import SampleGraphs, print_graph
+from graph.csr import CSRGraph
+
+"""
+Biconnectivity of undirected graphs, i.e. which single node or edge failures disconnect the graph
+- an articulation point (cut vertex) is a node whose removal increases the number of connected components
+- a bridge (cut edge) is an edge whose removal increases the number of connected components
+- a biconnected component is a maximal set of nodes that stays connected after the removal of any one of its nodes; two
+  biconnected components share at most one node, which is an articulation point, and every bridge is a biconnected
+  component of its own two endpoints
+
+All three are found in a single O(V + E) depth-first search pass (Hopcroft-Tarjan): every node gets a discovery index and
+a low-link, the smallest index reachable from its DFS subtree using at most one back edge (not counting the edge to its
+DFS parent). When a child finishes with low-link >= index of its parent, nothing in the subtree of the child reaches
+above the parent:
+- the parent is an articulation point (the DFS root only if it has at least two DFS children)
+- the nodes discovered since the child, plus the parent, form a biconnected component
+- if low-link > index of the parent, nothing reaches the parent either and the tree edge is a bridge
+The searches use explicit stacks instead of recursion, so they work for graphs with paths much longer than the recursion
+limit. Isolated nodes belong to no biconnected component; self loops are ignored.
+"""
+
+
+def biconnectivity(graph: Dict[str, Set]) -> Tuple[Set, List[Tuple], List[List]]:
+    """
+    Find articulation points, bridges and biconnected components of an undirected graph in a single DFS pass
+    Returns (articulation points, bridges as (DFS parent, child) pairs, biconnected components as lists of nodes)
+    """
+    index: Dict[Hashable, int] = {}
+    low: Dict[Hashable, int] = {}
+    articulation_points: Set = set()
+    bridges: List[Tuple] = []
+    components: List[List] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        root_children = 0
+        comp_stack = [root]  # nodes in discovery order whose biconnected component is not complete yet
+        stack: List[Tuple[Hashable, Optional[Hashable], object]] = [(root, None, iter(graph[root]))]
+        while stack:
+            node, parent, nbrs = stack[-1]
+            for nbr in nbrs:  # type: ignore
+                if nbr not in index:
+                    index[nbr] = low[nbr] = len(index)
+                    comp_stack.append(nbr)
+                    stack.append((nbr, node, iter(graph[nbr])))
+                    break  # descend into nbr
+                elif nbr != parent and index[nbr] < low[node]:
+                    low[node] = index[nbr]  # back edge
+            else:
+                stack.pop()
+                if parent is None:
+                    continue
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+                if low[node] >= index[parent]:
+                    if low[node] > index[parent]:
+                        bridges.append((parent, node))
+                    if parent == root:
+                        root_children += 1
+                    else:
+                        articulation_points.add(parent)
+                    component = [parent]
+                    while True:
+                        member = comp_stack.pop()
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        if root_children >= 2:
+            articulation_points.add(root)
+    return articulation_points, bridges, components
+
+
+def find_articulation_points(graph: Dict[str, Set]) -> Set:
+    """
+    Find the nodes of an undirected graph whose removal disconnects their connected component
+    """
+    return biconnectivity(graph)[0]
+
+
+def find_bridges(graph: Dict[str, Set]) -> List[Tuple]:
+    """
+    Find the edges of an undirected graph whose removal disconnects their connected component
+    """
+    return biconnectivity(graph)[1]
+
+
+def find_biconnected_components(graph: Dict[str, Set]) -> List[List]:
+    """
+    Find the biconnected components of an undirected graph, every component as a list of its nodes
+    """
+    return biconnectivity(graph)[2]
+
+
+def csr_biconnectivity(graph: CSRGraph) -> Tuple[Set[int], List[Tuple[int, int]], List[List[int]]]:
+    """
+    Same as `biconnectivity` over the integer ids of an undirected CSR graph, returns node ids instead of labels
+    Discovery indexes and low-links are flat integer arrays indexed by node id (-1 for undiscovered nodes) instead of
+    dicts, and every DFS stack frame holds a position in the targets array instead of an iterator
+    """
+    offsets, targets = graph.offsets, graph.targets
+    num_nodes = graph.num_nodes
+    index = array('l', [-1]) * num_nodes
+    low = array('l', [0]) * num_nodes
+    next_index = 0
+    articulation_points: Set[int] = set()
+    bridges: List[Tuple[int, int]] = []
+    components: List[List[int]] = []
+
+    for root in range(num_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = next_index
+        next_index += 1
+        root_children = 0
+        comp_stack = [root]
+        stack = [[root, -1, offsets[root]]]  # [node, DFS parent, position of the next neighbor in targets]
+        while stack:
+            frame = stack[-1]
+            node, parent, pos = frame
+            end = offsets[node + 1]
+            while pos < end:
+                nbr = targets[pos]
+                pos += 1
+                if index[nbr] == -1:
+                    index[nbr] = low[nbr] = next_index
+                    next_index += 1
+                    comp_stack.append(nbr)
+                    stack.append([nbr, node, offsets[nbr]])
+                    break  # descend into nbr
+                elif nbr != parent and index[nbr] < low[node]:
+                    low[node] = index[nbr]  # back edge
+            else:
+                stack.pop()
+                if parent == -1:
+                    continue
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+                if low[node] >= index[parent]:
+                    if low[node] > index[parent]:
+                        bridges.append((parent, node))
+                    if parent == root:
+                        root_children += 1
+                    else:
+                        articulation_points.add(parent)
+                    component = [parent]
+                    while True:
+                        member = comp_stack.pop()
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+                continue
+            frame[2] = pos  # resume after nbr once its subtree is done
+        if root_children >= 2:
+            articulation_points.add(root)
+    return articulation_points, bridges, components
+
+
+if __name__ == '__main__':
+    graph = SampleGraphs.undirected_cyclic_disconn_graph()
+    print_graph(graph, message="\nUndirected Cyclic Disconnected Graph")
+
+    articulation_points, bridges, components = biconnectivity(graph=graph.graph)
+    print("\n=> Articulation points, bridges and biconnected components in a single DFS pass")
+    print("Articulation points: {}".format(sorted(articulation_points)))
+    print("Bridges: {}".format(bridges))
+    print("Biconnected components: {}".format(components))
+
+    print("\n=> Same analysis over the integer ids of a CSR graph")
+    csr_graph = CSRGraph.from_graph(graph)
+    id_points, id_bridges, id_components = csr_biconnectivity(graph=csr_graph)
+    print("Articulation points: {}".format(sorted(csr_graph.label(node_id) for node_id in id_points)))
+    print("Bridges: {}".format([(csr_graph.label(u), csr_graph.label(v)) for u, v in id_bridges]))
+    print("Biconnected components: {}".format([[csr_graph.label(node_id) for node_id in component]
+                                                for component in id_components]))
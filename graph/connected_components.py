@@ -1,8 +1,23 @@
+from array import array
+from bisect import bisect_left
 from collections import deque
-from typing import Dict, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from graph import SampleGraphs, print_graph
-from unionfind import DisjointSetUnion
+from graph.csr import CSRGraph
+from graph.loaders import read_edge_list
+from unionfind import DisjointSetUnion, UnionMethod
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8, only the single process mode of `csr_conn_comp_ids` is available
+    shared_memory = None  # type: ignore
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, hooking and shortcutting loop over the edges in Python otherwise
+    np = None  # type: ignore
 
 
 def conn_comps_using_dfs(graph: Dict[str, Set]) -> int:
@@ -24,7 +39,7 @@ def conn_comps_using_dfs(graph: Dict[str, Set]) -> int:
     return comps
 
 
-def conn_comps_using_bfs(graph: Dict[str, Set]) -> int:
+def conn_comps_using_bfs(graph: Mapping[str, Iterable[str]]) -> int:
     """
     Find connected components in a graph using BFS
     Works for all types of graphs {directed, undirected, cyclic, acyclic}
@@ -60,6 +75,243 @@ def conn_comps_undirected_union_find(graph: Dict[str, Set]) -> int:
     return dsu.get_disjoint_set_count()
 
 
+def conn_comps_using_dfs_iterative(graph: Dict[str, Set]) -> int:
+    """
+    Stack-safe version of `conn_comps_using_dfs` using an explicit stack instead of recursion
+    Works for all types of graphs {directed, undirected, cyclic, acyclic}
+    """
+    visited = set()
+    comps = 0
+    for node in graph:
+        if node not in visited:
+            comps += 1
+            visited.add(node)
+            stack = [node]
+            while stack:
+                curr = stack.pop()
+                for nbr in graph[curr]:
+                    if nbr not in visited:
+                        visited.add(nbr)
+                        stack.append(nbr)
+    return comps
+
+
+def conn_comps_streaming_union_find(edges: Iterable[Tuple[str, str]], nodes: Iterable[str] = (),
+                                    dsu: Optional[DisjointSetUnion] = None) -> DisjointSetUnion:
+    """
+    Find connected components of an undirected graph from a stream of (node, node) edges using Disjoint Set Union
+    The adjacency is never materialized: every edge is consumed once and dropped, so memory scales with the number of
+    nodes and not the number of edges. Isolated nodes (without any edges) can be passed in `nodes`
+
+    Returns the Disjoint Set Union (union-by-size) holding the components:
+    - number of components => `get_disjoint_set_count()`
+    - size of the component of a node => `get_disjoint_set_size(node)`
+    - members of all components => `get_disjoint_sets()`
+    Pass an existing `dsu` to keep ingesting edges into the same components
+    """
+    if dsu is None:
+        dsu = DisjointSetUnion(union_method=UnionMethod.BY_SIZE)
+    dsu.make_set(nodes)
+    for node, nbr in edges:
+        dsu.make_set((node, nbr))
+        dsu.union_set(node, nbr)
+    return dsu
+
+
+def conn_comps_edge_file_union_find(path: str, delimiter: Optional[str] = None,
+                                    chunk_size: int = 1 << 20) -> DisjointSetUnion:
+    """
+    Find connected components of an undirected graph stored as an edge list file (one edge per line), see
+    `read_edge_list` for the file format; the file is read in chunks and edges are streamed into Disjoint Set Union
+    """
+    return conn_comps_streaming_union_find(read_edge_list(path, delimiter=delimiter, chunk_size=chunk_size))
+
+
+def csr_conn_comp_ids(graph: CSRGraph, processes: int = 1) -> Sequence[int]:
+    """
+    Label the connected components of a CSR graph, returns array('l') mapping every node id to the smallest node id of
+    its component; for directed graphs, edges are followed in both directions (weakly connected components)
+
+    Hooking and shortcutting (Shiloach–Vishkin style) over a forest of parent pointers, starting with every node as
+    its own root; every round:
+    1. Hooking: every edge between two different trees proposes to hook the larger root under the smaller one, and
+       every root is hooked under the smallest root proposed for it. Parents only ever decrease, so the pointers always
+       form a forest and the smallest node id of a component is never hooked: it ends up as the root of the component
+    2. Shortcutting: every node points directly to the root of its tree (pointer jumping), so that the next hooking
+       round sees roots only
+    Rounds stop when no edge connects two trees anymore. Both phases are independent per edge/node, so they are
+    vectorized with NumPy when available.
+
+    With processes > 1, offsets, targets and parents live in `multiprocessing.shared_memory` blocks attached (not
+    copied) by a pool of worker processes, and the nodes are split into ranges holding about the same number of edges:
+    - hooking workers only read the shared arrays and send back their proposals, which are merged and applied by this
+      process, so no two processes ever write the same parent
+    - shortcutting workers only write the parents of their own range; a parent read from another range may be
+      concurrently shortcut, but both the old and the new value are ancestors in the same tree, so the race is benign
+    """
+    num_nodes, num_edges = graph.num_nodes, graph.num_edges
+    if processes <= 1 or num_nodes == 0:
+        parents = array('l', range(num_nodes))
+        vectors = [_as_vector(buffer) for buffer in (graph.offsets, graph.targets, parents)]
+        try:
+            _label_components(vectors[2], lambda: _hook(vectors, 0, num_nodes), lambda: _shortcut(vectors, 0, num_nodes))
+        finally:
+            del vectors  # release the NumPy views over the buffers
+        return parents
+
+    if shared_memory is None:
+        raise RuntimeError("Parallel component labelling requires multiprocessing.shared_memory (Python 3.8+)")
+    node_ranges = _edge_balanced_ranges(graph.offsets, processes)
+    blocks = [_to_shared_memory(buffer, length) for buffer, length in
+              ((graph.offsets, num_nodes + 1), (graph.targets, num_edges), (range(num_nodes), num_nodes))]
+    parents_view = blocks[2].buf[:8 * num_nodes].cast('q')
+    shared_parents: Any = _as_vector(parents_view)
+    try:
+        init_args = ([block.name for block in blocks], num_nodes, num_edges)
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=init_args) as executor:
+            _label_components(shared_parents,
+                              lambda: _merge_hooks(executor.map(_hook_in_worker, node_ranges)),
+                              lambda: list(executor.map(_shortcut_in_worker, node_ranges)))
+        return array('l', parents_view)
+    finally:
+        del shared_parents
+        parents_view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def conn_comps_parallel(graph: Union[Dict[str, Set], CSRGraph], processes: int = 1) -> Dict[str, str]:
+    """
+    Label the connected components of a graph using hooking and shortcutting (see `csr_conn_comp_ids`), optionally
+    in parallel over shared memory; returns the representative of the component of every node (all nodes of a
+    component get the same representative), the number of components is the number of distinct representatives
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+    labels = csr.labels
+    return {labels[node_id]: labels[comp_id] for node_id, comp_id in enumerate(csr_conn_comp_ids(csr, processes))}
+
+
+def _label_components(parents, hook, shortcut) -> None:
+    while True:
+        proposals = hook()
+        if not proposals:
+            break  # no edge between two different trees, every tree is a component
+        for root, new_parent in proposals.items():
+            parents[root] = new_parent
+        shortcut()
+
+
+def _hook(vectors, lo: int, hi: int) -> Dict[int, int]:
+    """
+    Smallest root proposed by the edges of nodes [lo, hi) for every larger root they connect to
+    """
+    offsets, targets, parents = vectors
+    proposals: Dict[int, int] = {}
+    if np is not None:
+        sources = np.repeat(np.arange(lo, hi), np.diff(offsets[lo:hi + 1]))
+        source_roots, target_roots = parents[sources], parents[targets[offsets[lo]:offsets[hi]]]
+        crossing = source_roots != target_roots
+        high = np.maximum(source_roots[crossing], target_roots[crossing])
+        low = np.minimum(source_roots[crossing], target_roots[crossing])
+        order = np.lexsort((low, high))  # by root, then by proposed parent
+        high, low = high[order], low[order]
+        first = np.concatenate(([True], high[1:] != high[:-1])) if len(high) else high.astype(bool)
+        return dict(zip(high[first].tolist(), low[first].tolist()))
+
+    for node in range(lo, hi):
+        root = parents[node]
+        for nbr in targets[offsets[node]:offsets[node + 1]]:
+            nbr_root = parents[nbr]
+            if root != nbr_root:
+                high, low = (root, nbr_root) if root > nbr_root else (nbr_root, root)
+                if low < proposals.get(high, high):
+                    proposals[high] = low
+    return proposals
+
+
+def _shortcut(vectors, lo: int, hi: int) -> None:
+    """
+    Point every node of [lo, hi) directly to the root of its tree, by pointer doubling: every pass replaces the parent
+    of every node by its grandparent, which halves the distance of every node to its root, until all parents are roots
+    Hooking under the smallest root can build trees of depth O(V) (eg: a path whose node ids alternate between both
+    ends of the id range), which takes O(log(depth)) passes instead of O(depth) steps per node when walking up to
+    the root of every node
+    """
+    parents = vectors[2]
+    if np is not None:
+        segment = parents[lo:hi]  # view, updated in place by every pass
+        while True:
+            grandparents = parents[segment]
+            if np.array_equal(grandparents, segment):
+                break
+            segment[:] = grandparents
+        return
+
+    changed = True
+    while changed:
+        changed = False
+        for node in range(lo, hi):
+            parent = parents[node]
+            grandparent = parents[parent]
+            if parent != grandparent:
+                parents[node] = grandparent
+                changed = True
+
+
+def _merge_hooks(all_proposals: Iterable[Dict[int, int]]) -> Dict[int, int]:
+    merged: Dict[int, int] = {}
+    for proposals in all_proposals:
+        for root, new_parent in proposals.items():
+            if new_parent < merged.get(root, root):
+                merged[root] = new_parent
+    return merged
+
+
+def _as_vector(buffer: Any) -> Any:
+    return np.asarray(memoryview(buffer)) if np is not None else buffer
+
+
+def _edge_balanced_ranges(offsets: Sequence[int], parts: int) -> List[Tuple[int, int]]:
+    """
+    Split node ids into at most `parts` contiguous ranges with about the same number of edges each
+    """
+    num_nodes, num_edges = len(offsets) - 1, offsets[-1]
+    bounds = [0]
+    for part in range(1, parts):
+        bound = bisect_left(offsets, part * num_edges // parts) if num_edges else part * num_nodes // parts
+        bounds.append(min(max(bound, bounds[-1]), num_nodes))
+    bounds.append(num_nodes)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+def _to_shared_memory(values: Iterable[int], length: int) -> Any:
+    block = shared_memory.SharedMemory(create=True, size=max(1, 8 * length))
+    buffer = block.buf
+    assert buffer is not None  # only None once the block is closed
+    buffer[:8 * length] = memoryview(array('q', values)).cast('B')
+    return block
+
+
+_worker_blocks: List[Any] = []
+_worker_vectors: List[Any] = []
+
+
+def _init_worker(block_names: List[str], num_nodes: int, num_edges: int) -> None:
+    _worker_blocks[:] = [shared_memory.SharedMemory(name=name) for name in block_names]
+    lengths = (num_nodes + 1, num_edges, num_nodes)
+    _worker_vectors[:] = [_as_vector(block.buf[:8 * length].cast('q'))
+                          for block, length in zip(_worker_blocks, lengths)]
+
+
+def _hook_in_worker(node_range: Tuple[int, int]) -> Dict[int, int]:
+    return _hook(_worker_vectors, node_range[0], node_range[1])
+
+
+def _shortcut_in_worker(node_range: Tuple[int, int]) -> None:
+    _shortcut(_worker_vectors, node_range[0], node_range[1])
+
+
 if __name__ == '__main__':
     undirected_connected_graph = SampleGraphs.undirected_cyclic_conn_graph().graph
     undirected_disconnected_graph = SampleGraphs.undirected_cyclic_disconn_graph().graph
@@ -84,3 +336,21 @@ if __name__ == '__main__':
     print(conn_comps_undirected_union_find(graph=undirected_connected_graph))
     print("\n-> Undirected Disconnected Graph")
     print(conn_comps_undirected_union_find(graph=undirected_disconnected_graph))
+
+    print("\n=> Connected Components in a graph using iterative DFS; works for all types of graphs {directed, undirected, cyclic, acyclic}")
+    print("\n-> Connected Graph")
+    print(conn_comps_using_dfs_iterative(graph=undirected_connected_graph))
+    print("\n-> Disconnected Graph")
+    print(conn_comps_using_dfs_iterative(graph=undirected_disconnected_graph))
+
+    print("\n=> Connected Components in an Undirected Graph from a stream of edges using Disjoint Set Union (Union-Find)")
+    edge_stream = ((node, nbr) for node, nbrs in undirected_disconnected_graph.items() for nbr in nbrs)
+    streamed_dsu = conn_comps_streaming_union_find(edges=edge_stream)
+    print("Components: {}".format(streamed_dsu.get_disjoint_set_count()))
+    print("Members: {}".format(streamed_dsu.get_disjoint_sets()))
+    print("Size of the component of 'A': {}".format(streamed_dsu.get_disjoint_set_size('A')))
+
+    print("\n=> Connected Components labelled by hooking and shortcutting, in a pool of processes over shared memory")
+    parallel_labels = conn_comps_parallel(graph=undirected_disconnected_graph, processes=2)
+    print("Labels: {}".format(parallel_labels))
+    print("Components: {}".format(len(set(parallel_labels.values()))))
@@ -0,0 +1,320 @@
+from array import array
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Iterator, Mapping as MappingType, Optional, Sequence, Set
+
+from graph import Graph, SampleGraphs, print_graph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, `array` buffers are used otherwise
+    np = None  # type: ignore
+
+
+class CSRGraph(Mapping):
+    """
+    Compressed Sparse Row (CSR) representation of a graph - a compact alternative to `Graph`
+
+    Node labels are interned to dense integer ids [0, n) and the adjacency is stored in two flat integer buffers:
+    - offsets: n + 1 entries, neighbors of node id `i` are `targets[offsets[i]:offsets[i + 1]]`
+    - targets: m entries, one per (directed) edge; undirected edges are stored in both directions like in `Graph`
+
+    An adjacency of the form `Dict[str, Set]` pays for a hash set per node and a hash table slot per edge (hundreds of
+    bytes per edge), whereas CSR only pays for one machine word per edge. Neighbors of a node are also contiguous in
+    memory which makes traversals over the integer ids cache-friendly.
+
+    `CSRGraph` implements the read-only `Mapping` protocol (`graph[node]`, `graph.keys()`, `graph.items()`,
+    `for node in graph`, ...) and returns a frozenset of neighbor labels for `graph[node]`, so it can be passed directly
+    to functions written against the `Dict[str, Set]` adjacency. It also exposes `graph` and `is_directed` attributes
+    like `Graph` so call sites using `some_graph.graph` keep working. Functions that mutate the adjacency are not
+    supported as the CSR buffers are immutable.
+
+    For the fastest traversals use the integer level API (`node_id`, `neighbor_ids`, `offsets`, `targets`) or the
+    `csr_*` helpers below, which never materialize label sets.
+    """
+    def __init__(self, labels: Sequence[str], offsets: Sequence[int], targets: Sequence[int], is_directed: bool = False):
+        if len(offsets) != len(labels) + 1:
+            raise ValueError("Expected {} offsets for {} nodes, got {}".format(len(labels) + 1, len(labels), len(offsets)))
+        self._labels = labels
+        self._ids: Optional[MappingType[str, int]] = None  # label -> id, built lazily on first label lookup
+        self._offsets = offsets
+        self._targets = targets
+        self.is_directed = is_directed
+
+    @classmethod
+    def from_dict(cls, graph: Dict[str, Set], is_directed: bool = False) -> 'CSRGraph':
+        """
+        Build a CSR graph from an adjacency dict in a single pass over the edges
+        Node ids follow the insertion order of the dict; nodes only present as neighbors are appended at the end
+        """
+        ids = {node: i for i, node in enumerate(graph)}
+        labels = list(graph)
+        offsets = array('l', [0])
+        targets = array('l')
+        for nbrs in graph.values():
+            for nbr in nbrs:
+                nbr_id = ids.get(nbr)
+                if nbr_id is None:
+                    nbr_id = ids[nbr] = len(labels)
+                    labels.append(nbr)
+                targets.append(nbr_id)
+            offsets.append(len(targets))
+        # nodes discovered only as neighbors have no outgoing edges
+        offsets.extend([len(targets)] * (len(labels) - len(graph)))
+
+        csr = cls(labels=labels, offsets=offsets, targets=targets, is_directed=is_directed)
+        csr._ids = ids
+        return csr
+
+    @classmethod
+    def from_edge_arrays(cls, labels: Sequence[str], sources: Sequence[int], targets: Sequence[int],
+                         is_directed: bool = False, deduplicate: bool = True) -> 'CSRGraph':
+        """
+        Build a CSR graph from parallel arrays of edge (source id, target id) pairs, sorting the edges by source
+        Undirected edges must be present in both directions; with deduplicate=True repeated edges are stored once, like
+        in a `Dict[str, Set]` adjacency
+        With NumPy, edges are sorted (and deduplicated) as a single array of source * n + target keys without any
+        per-edge Python work; otherwise edges are bucketed by source with a counting sort in O(V + E)
+        """
+        num_nodes = len(labels)
+        if np is not None:
+            keys = np.asarray(sources, dtype=np.int64) * num_nodes
+            keys += np.asarray(targets, dtype=np.int64)
+            keys.sort()
+            if deduplicate and len(keys):
+                keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+            counts = np.bincount(keys // max(num_nodes, 1), minlength=num_nodes)
+            offsets = array('l', [0])
+            offsets.frombytes(np.cumsum(counts, dtype=np.dtype('l')).tobytes())
+            csr_targets = array('l')
+            csr_targets.frombytes((keys % max(num_nodes, 1)).astype(np.dtype('l')).tobytes())
+            return cls(labels=labels, offsets=offsets, targets=csr_targets, is_directed=is_directed)
+
+        offsets = array('l', [0]) * (num_nodes + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for node_id in range(num_nodes):
+            offsets[node_id + 1] += offsets[node_id]
+        csr_targets = array('l', [0]) * len(targets)
+        next_slot = array('l', offsets)
+        for source, target in zip(sources, targets):
+            csr_targets[next_slot[source]] = target
+            next_slot[source] += 1
+
+        if deduplicate:
+            unique_offsets, unique_targets = array('l', [0]), array('l')
+            for node_id in range(num_nodes):
+                unique_targets.extend(sorted(set(csr_targets[offsets[node_id]:offsets[node_id + 1]])))
+                unique_offsets.append(len(unique_targets))
+            offsets, csr_targets = unique_offsets, unique_targets
+        return cls(labels=labels, offsets=offsets, targets=csr_targets, is_directed=is_directed)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CSRGraph':
+        """
+        Build a CSR graph from an existing `Graph` instance
+        """
+        return cls.from_dict(graph.graph, is_directed=graph.is_directed)
+
+    def transpose(self) -> 'CSRGraph':
+        """
+        Get the CSR graph with all edges reversed (counting sort of the edges by target), in O(V + E) time
+        For undirected graphs, the transpose has the same edges
+        """
+        num_nodes, offsets, targets = self.num_nodes, self._offsets, self._targets
+        in_offsets = array('l', [0]) * (num_nodes + 1)
+        for target in targets:
+            in_offsets[target + 1] += 1
+        for node_id in range(num_nodes):
+            in_offsets[node_id + 1] += in_offsets[node_id]
+
+        sources = array('l', [0]) * len(targets)
+        next_slot = array('l', in_offsets)
+        for node_id in range(num_nodes):
+            for target in targets[offsets[node_id]:offsets[node_id + 1]]:
+                sources[next_slot[target]] = node_id
+                next_slot[target] += 1
+
+        csr = CSRGraph(labels=self._labels, offsets=in_offsets, targets=sources, is_directed=self.is_directed)
+        csr._ids = self._ids
+        return csr
+
+    def to_graph(self) -> Graph:
+        """
+        Convert back to a `Graph` with a `Dict[str, Set]` adjacency
+        """
+        return Graph(graph={node: set(nbrs) for node, nbrs in self.items()}, is_directed=self.is_directed)
+
+    # ----- Graph compatibility -----
+
+    @property
+    def graph(self) -> 'CSRGraph':
+        """
+        The adjacency of the graph, which is the CSR graph itself; mirrors `Graph.graph`
+        """
+        return self
+
+    # ----- Integer level API -----
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._labels)
+
+    @property
+    def num_edges(self) -> int:
+        """
+        Number of stored (directed) edges; an undirected edge is counted twice like in `Dict[str, Set]` adjacency
+        """
+        return len(self._targets)
+
+    @property
+    def labels(self) -> Sequence[str]:
+        return self._labels
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        return self._offsets
+
+    @property
+    def targets(self) -> Sequence[int]:
+        return self._targets
+
+    def node_id(self, label: str) -> int:
+        if self._ids is None:
+            self._ids = {node: i for i, node in enumerate(self._labels)}
+        return self._ids[label]
+
+    def label(self, node_id: int) -> str:
+        return self._labels[node_id]
+
+    def neighbor_ids(self, node_id: int) -> Sequence[int]:
+        return self._targets[self._offsets[node_id]:self._offsets[node_id + 1]]
+
+    def degree(self, node_id: int) -> int:
+        return self._offsets[node_id + 1] - self._offsets[node_id]
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy views (offsets, targets) over the CSR buffers; requires NumPy
+        """
+        if np is None:
+            raise ImportError("NumPy is required for `CSRGraph.as_numpy`")
+        return np.asarray(memoryview(self._offsets)), np.asarray(memoryview(self._targets))
+
+    def memory_usage(self) -> int:
+        """
+        Approximate number of bytes used by the CSR buffers (excluding the node labels)
+        """
+        return sum(buffer.itemsize * len(buffer) for buffer in (self._offsets, self._targets))  # type: ignore
+
+    # ----- Mapping protocol -----
+
+    def __getitem__(self, label: str) -> FrozenSet[str]:
+        labels = self._labels
+        return frozenset([labels[nbr_id] for nbr_id in self.neighbor_ids(self.node_id(label))])
+
+    def __contains__(self, label) -> bool:
+        try:
+            self.node_id(label)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._labels)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __repr__(self):
+        return "CSRGraph@{}: {}\n-> Nodes: {}\n-> Edges: {}".format(
+            id(self),
+            self.is_directed and "Directed" or "Undirected",
+            self.num_nodes,
+            self.num_edges
+        )
+
+
+def csr_dfs(graph: CSRGraph, start_node: str) -> Set:
+    """
+    Iterative DFS over the integer ids of a CSR graph, returns the set of visited node labels
+    Works for all types of graphs {directed, undirected, cyclic, acyclic, connected, disconnected}
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_nodes)  # one byte per node instead of a hash set entry
+    start_id = graph.node_id(start_node)
+    visited[start_id] = 1
+    stack = [start_id]
+    while stack:
+        node_id = stack.pop()
+        for nbr_id in targets[offsets[node_id]:offsets[node_id + 1]]:
+            if not visited[nbr_id]:
+                visited[nbr_id] = 1
+                stack.append(nbr_id)
+    return _labels_of(graph, visited)
+
+
+def csr_bfs(graph: CSRGraph, start_node: str) -> Set:
+    """
+    Iterative BFS over the integer ids of a CSR graph, returns the set of visited node labels
+    Same as `bfs_iterative_optimized`, nodes are marked visited before they are enqueued
+    The queue is a flat list with a moving head pointer as every node is enqueued at most once
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_nodes)
+    start_id = graph.node_id(start_node)
+    visited[start_id] = 1
+    queue = [start_id]
+    head = 0
+    while head < len(queue):
+        node_id = queue[head]
+        head += 1
+        for nbr_id in targets[offsets[node_id]:offsets[node_id + 1]]:
+            if not visited[nbr_id]:
+                visited[nbr_id] = 1
+                queue.append(nbr_id)
+    return _labels_of(graph, visited)
+
+
+def _labels_of(graph: CSRGraph, visited: bytearray) -> Set:
+    labels = graph.labels
+    return {labels[i] for i, flag in enumerate(visited) if flag}
+
+
+if __name__ == '__main__':
+    import sys
+
+    from graph.traversals import bfs_iterative_optimized, dfs_iterative
+    from graph.topological_sorting import top_sort_bfs, top_sort_dfs
+    from graph.connected_components import conn_comps_using_bfs
+
+    graph = SampleGraphs.directed_acyclic_disconn_graph()
+    csr_graph = CSRGraph.from_graph(graph)
+
+    print_graph(graph, message="\nGraph")
+    print("\nCSR Graph")
+    print(csr_graph)
+    print("-> Labels: {}".format(list(csr_graph.labels)))
+    print("-> Offsets: {}".format(list(csr_graph.offsets)))
+    print("-> Targets: {}".format(list(csr_graph.targets)))
+
+    dict_size = sys.getsizeof(graph.graph) + sum(sys.getsizeof(nbrs) for nbrs in graph.graph.values())
+    print("\nAdjacency dict size (bytes, excluding labels): {}".format(dict_size))
+    print("CSR buffers size (bytes, excluding labels): {}".format(csr_graph.memory_usage()))
+
+    print("\n=> Existing algorithms accept a CSRGraph directly")
+    print("\n-> DFS Iterative")
+    print(dfs_iterative(graph=csr_graph, start_node='A'))
+    print("\n-> BFS Iterative Optimized")
+    print(bfs_iterative_optimized(graph=csr_graph, start_node='A'))
+    print("\n-> Connected Components using BFS")
+    print(conn_comps_using_bfs(graph=csr_graph))
+    print("\n-> Topological Sort using DFS")
+    print(top_sort_dfs(graph=csr_graph))
+    print("\n-> Topological Sort using BFS")
+    print(top_sort_bfs(graph=csr_graph))
+
+    print("\n=> Integer level traversals")
+    print("\n-> CSR DFS")
+    print(csr_dfs(graph=csr_graph, start_node='A'))
+    print("\n-> CSR BFS")
+    print(csr_bfs(graph=csr_graph, start_node='A'))
@@ -0,0 +1,178 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import BinaryIO, Iterator, List, Union, overload
+
+from graph import Graph, SampleGraphs, print_graph
+from graph.csr import CSRGraph
+
+"""
+Binary CSR graph file format, designed to be memory-mapped instead of parsed
+
+    header          32 bytes: magic b'CSRG', version (uint16), flags (uint16, bit 0 = directed),
+                    num_nodes, num_edges, num_label_bytes (uint64 each)
+    offsets         int64 x (num_nodes + 1)   CSR offsets
+    targets         int64 x num_edges         CSR targets
+    label_offsets   int64 x (num_nodes + 1)   node id -> [start, end) of its UTF-8 label in the label data
+    label_order     int64 x num_nodes         node ids sorted by label, for label -> node id lookups
+    label_data      num_label_bytes           UTF-8 encoded labels, concatenated
+
+All integers are little-endian and every int64 section starts at a multiple of 8 bytes, so the sections are used in
+place as `memoryview`s cast to int64; opening a file only maps it and reads the header, whatever its size.
+"""
+
+_MAGIC = b'CSRG'
+_VERSION = 1
+_FLAG_DIRECTED = 1
+_HEADER = struct.Struct('<4sHHQQQ')
+
+
+class _LabelTable(Sequence):
+    """
+    Node id -> label, decoded from the mapped label data on access
+    """
+    def __init__(self, label_offsets: memoryview, label_data: memoryview):
+        self._label_offsets = label_offsets
+        self._label_data = label_data
+
+    @overload
+    def __getitem__(self, node_id: int) -> str: ...
+
+    @overload
+    def __getitem__(self, node_ids: slice) -> List[str]: ...
+
+    def __getitem__(self, node_id: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(node_id, slice):
+            return [self[i] for i in range(*node_id.indices(len(self)))]
+        if node_id < 0:
+            node_id += len(self)
+        if not 0 <= node_id < len(self):
+            raise IndexError("Node id out of range: {}".format(node_id))
+        return str(self._label_data[self._label_offsets[node_id]:self._label_offsets[node_id + 1]], 'utf-8')
+
+    def __len__(self) -> int:
+        return len(self._label_offsets) - 1
+
+
+class _LabelIndex(Mapping):
+    """
+    Label -> node id, using a binary search over the node ids sorted by label
+    Replaces the label -> id dict of `CSRGraph` so that no per-node object is created when the file is opened
+    """
+    def __init__(self, labels: _LabelTable, label_order: memoryview):
+        self._labels = labels
+        self._label_order = label_order
+
+    def __getitem__(self, label: str) -> int:
+        labels, order = self._labels, self._label_order
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if labels[order[mid]] < label:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and labels[order[lo]] == label:
+            return order[lo]
+        raise KeyError(label)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._labels[node_id] for node_id in self._label_order)
+
+    def __len__(self) -> int:
+        return len(self._label_order)
+
+
+def write_csr_file(graph: Union[Graph, CSRGraph], path: str) -> None:
+    """
+    Write a graph (node labels must be strings) to a binary CSR graph file
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    encoded_labels = [label.encode('utf-8') for label in csr.labels]
+    label_offsets = array('q', [0])
+    for encoded_label in encoded_labels:
+        label_offsets.append(label_offsets[-1] + len(encoded_label))
+    labels = csr.labels
+    label_order = array('q', sorted(range(csr.num_nodes), key=labels.__getitem__))
+
+    with open(path, 'wb') as f:
+        flags = _FLAG_DIRECTED if csr.is_directed else 0
+        f.write(_HEADER.pack(_MAGIC, _VERSION, flags, csr.num_nodes, csr.num_edges, label_offsets[-1]))
+        for section in (array('q', csr.offsets), array('q', csr.targets), label_offsets, label_order):
+            _write_little_endian(f, section)
+        f.write(b''.join(encoded_labels))
+
+
+def open_csr_file(path: str) -> CSRGraph:
+    """
+    Open a binary CSR graph file as a `CSRGraph` backed by a read-only memory map of the file (zero-copy)
+    - nothing is parsed or copied: offsets and targets are int64 views over the mapped pages, loaded by the OS on
+      first access, and labels are decoded only when they are looked up
+    - the pages are shared through the OS page cache, so worker processes opening the same file share one copy of the
+      graph in memory instead of one copy per process
+    The returned graph works with every function accepting a `CSRGraph` or a `Dict[str, Set]` adjacency
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Memory-mapped CSR graph files require a little-endian platform")
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # the map stays valid after the file is closed
+
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Not a CSR graph file: {}".format(path))
+    magic, version, flags, num_nodes, num_edges, num_label_bytes = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a CSR graph file (version {}): {}".format(_VERSION, path))
+    section_lengths = [num_nodes + 1, num_edges, num_nodes + 1, num_nodes]
+    if len(buffer) != _HEADER.size + 8 * sum(section_lengths) + num_label_bytes:
+        raise ValueError("Truncated or corrupted CSR graph file: {}".format(path))
+
+    view = memoryview(buffer)
+    sections = []
+    start = _HEADER.size
+    for length in section_lengths:
+        sections.append(view[start:start + 8 * length].cast('q'))
+        start += 8 * length
+    offsets, targets, label_offsets, label_order = sections
+    label_data = view[start:]
+
+    labels = _LabelTable(label_offsets, label_data)
+    csr = CSRGraph(labels=labels, offsets=offsets, targets=targets, is_directed=bool(flags & _FLAG_DIRECTED))
+    csr._ids = _LabelIndex(labels, label_order)
+    return csr
+
+
+def _write_little_endian(f: BinaryIO, section: array) -> None:
+    if sys.byteorder != 'little':
+        section = array(section.typecode, section)
+        section.byteswap()
+    section.tofile(f)
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+
+    from graph.traversals import bfs_iterative_optimized, bfs_lazy, dfs_iterative
+
+    graph = SampleGraphs.directed_cyclic_disconn_graph()
+    print_graph(graph, message="\nGraph")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'graph.csr')
+        write_csr_file(graph, path)
+        print("\n=> Written to a CSR graph file of {} bytes".format(os.path.getsize(path)))
+
+        mapped_graph = open_csr_file(path)
+        print(mapped_graph)
+        print("-> Labels: {}".format(list(mapped_graph.labels)))
+
+        print("\n=> Traversals running directly on the memory-mapped buffers")
+        print("\n-> DFS Iterative")
+        print(dfs_iterative(graph=mapped_graph, start_node='A'))
+        print("\n-> BFS Iterative Optimized")
+        print(bfs_iterative_optimized(graph=mapped_graph, start_node='A'))
+        print("\n-> Lazy BFS with (node, depth, parent)")
+        print(list(bfs_lazy(graph=mapped_graph, start_node='A', with_info=True)))
+        del mapped_graph
@@ -1,34 +1,43 @@
-from typing import Dict, Set
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Set
 
 from graph import SampleGraphs, Markers, print_graph
+from graph.strongly_connected_components import scc_tarjan
 from unionfind import DisjointSetUnion
 
+"""
+Cycle detection functions return the cycle found as a list of nodes [n1, n2, ..., nk] (edges n1 -> n2 -> ... -> nk and
+nk -> n1 back to the first node), or None if the graph has no cycle; a found cycle is truthy, so the result can also be
+used as a boolean. The cycle is extracted from the DFS stack at the moment it is detected, i.e. in the same single
+pass, O(V + E).
+"""
+
 
 def find_cycles_undirected_using_edge_count(graph: Dict[str, Set]) -> bool:
     """
     Check if a cycle exists in an undirected graph using number of edges and numer of nodes
-    If number of edges > number of nodes => graph has a cycle
+    If number of edges >= number of nodes => graph has a cycle (exact for connected graphs, where an acyclic graph is a
+    tree with exactly n - 1 edges)
+    Edges are counted from the adjacency sizes without modifying the graph; every edge is present in both directions,
+    except self loops which are present once
     """
-    def get_edge_count(graph):
-        num_edges = 0
-        for node, nbrs in graph.items():
-            for nbr in nbrs:
-                num_edges += 1
-                graph[nbr].remove(node)  # bidirected edges in an undirected graph
-        return num_edges  # if not removing bidirectional edges, return num_edges // 2
-
     num_nodes = len(graph.keys())
-    num_edges = get_edge_count(graph)
+    num_adjacency_entries = sum(len(nbrs) for nbrs in graph.values())
+    num_self_loops = sum(1 for node, nbrs in graph.items() if node in nbrs)
+    num_edges = (num_adjacency_entries + num_self_loops) // 2
     return num_edges >= num_nodes
 
 
-def find_cycles_undirected_union_find(graph: Dict[str, Set]) -> bool:
+def find_cycles_undirected_union_find(graph: Dict[str, Set]) -> Optional[List]:
     """
-    Check if a cycle exists in an undirected graph using Disjoint Set Union
+    Find a cycle in an undirected graph using Disjoint Set Union
     Even if a single union operation is not performed => graph has a cycle
+    The edges accepted so far form a forest, so the cycle closed by the rejected edge (node, nbr) is that edge plus the
+    forest path between its endpoints, found with a BFS over the forest in O(V)
     """
     dsu = DisjointSetUnion()
     dsu.make_set(graph.keys())
+    forest: Dict[str, Set] = {node: set() for node in graph}
 
     visited = set()
     for node, nbrs in graph.items():
@@ -38,54 +47,272 @@ def find_cycles_undirected_union_find(graph: Dict[str, Set]) -> bool:
                 # this makes sure same edge is not reconsidered twice; eg: A -- B is same as B -- A for undirected graph
                 union_performed = dsu.union_set(node, nbr)
                 if not union_performed:
-                    return True
+                    return _forest_path(forest, nbr, node)
+                forest[node].add(nbr)
+                forest[nbr].add(node)
         visited.add(node)
-    return False
+    return None
 
 
-def find_cycles_undirected_dfs(graph: Dict[str, Set]) -> bool:
+def _forest_path(forest: Dict[str, Set], start: str, goal: str) -> List:
+    parents: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while goal not in parents:
+        node = queue.popleft()
+        for nbr in forest[node]:
+            if nbr not in parents:
+                parents[nbr] = node
+                queue.append(nbr)
+    path = []
+    cursor: Optional[str] = goal
+    while cursor is not None:
+        path.append(cursor)
+        cursor = parents[cursor]
+    return path  # goal -> ... -> start, which is closed by the edge start -- goal
+
+
+def find_cycles_undirected_dfs(graph: Dict[str, Set]) -> Optional[List]:
     """
-    Check if a cycle exists in an undirected graph using DFS and `prev` pointer
+    Find a cycle in an undirected graph using DFS and `prev` pointer
+    In an undirected DFS, the first visited neighbor found (other than `prev`) is always an ancestor on the current DFS
+    path, so the cycle is the part of the path from that neighbor to the current node
     """
-    def _dfs(graph, node, prev, visited):
+    def _dfs(graph, node, prev, visited, path):
         visited.add(node)
+        path.append(node)
         for nbr in graph[node]:
             if nbr != prev:  # ignore bidirected edges in an undirected graph causing trivial cycles
                 if nbr in visited:
-                    return True  # cycle found
-                if _dfs(graph, nbr, node, visited):
-                    return True
-        return False  # all neighbors visited, no cycle found so far
+                    return path[path.index(nbr):]  # cycle found
+                cycle = _dfs(graph, nbr, node, visited, path)
+                if cycle:
+                    return cycle
+        path.pop()
+        return None  # all neighbors visited, no cycle found so far
 
     visited = set()
     for node in graph:
         if node not in visited:
-            if _dfs(graph, node, '#', visited):
-                return True
-    return False
+            cycle = _dfs(graph, node, '#', visited, [])
+            if cycle:
+                return cycle
+    return None
 
 
-def find_cycles_directed_dfs(graph: Dict[str, Set]) -> bool:
+def find_cycles_directed_dfs(graph: Dict[str, Set]) -> Optional[List]:
     """
-    Check if a cycle exists in a directed graph using DFS and visit markers method
+    Find a cycle in a directed graph using DFS and visit markers method
+    Nodes being visited are exactly the nodes on the current DFS path, so the cycle is the part of the path from the
+    neighbor being visited to the current node
     """
-    def _dfs(graph, node, markers):
+    def _dfs(graph, node, markers, path):
         markers[node] = Markers.BEING_VISITED
+        path.append(node)
         for nbr in graph[node]:
             if markers[nbr] == Markers.BEING_VISITED:
-                return True  # cycle found
+                return path[path.index(nbr):]  # cycle found
             if markers[nbr] == Markers.NOT_VISITED:
-                if _dfs(graph, nbr, markers):
-                    return True
+                cycle = _dfs(graph, nbr, markers, path)
+                if cycle:
+                    return cycle
         markers[node] = Markers.VISITED
-        return False  # all neighbors visited, no cycle found so far
+        path.pop()
+        return None  # all neighbors visited, no cycle found so far
 
     markers = dict.fromkeys(graph, Markers.NOT_VISITED)
     for node in graph:
         if markers[node] == Markers.NOT_VISITED:
-            if _dfs(graph, node, markers):
-                return True
-    return False
+            cycle = _dfs(graph, node, markers, [])
+            if cycle:
+                return cycle
+    return None
+
+
+def find_cycles_undirected_dfs_iterative(graph: Dict[str, Set]) -> Optional[List]:
+    """
+    Stack-safe version of `find_cycles_undirected_dfs` using an explicit stack of (node, prev, neighbor iterator)
+    entries instead of recursion; neighbors are explored in the same order as the recursive version
+    """
+    visited = set()
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, '#', iter(graph[root]))]
+        while stack:
+            node, prev, nbrs = stack[-1]
+            for nbr in nbrs:
+                if nbr != prev:  # ignore bidirected edges in an undirected graph causing trivial cycles
+                    if nbr in visited:
+                        path = [entry[0] for entry in stack]
+                        return path[path.index(nbr):]  # cycle found
+                    visited.add(nbr)
+                    stack.append((nbr, node, iter(graph[nbr])))
+                    break
+            else:
+                stack.pop()  # all neighbors visited, no cycle found so far
+    return None
+
+
+def find_cycles_directed_dfs_iterative(graph: Dict[str, Set]) -> Optional[List]:
+    """
+    Stack-safe version of `find_cycles_directed_dfs` using visit markers and an explicit stack of neighbor iterators
+    """
+    markers = dict.fromkeys(graph, Markers.NOT_VISITED)
+    for root in graph:
+        if markers[root] != Markers.NOT_VISITED:
+            continue
+        markers[root] = Markers.BEING_VISITED
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, nbrs = stack[-1]
+            for nbr in nbrs:
+                if markers[nbr] == Markers.BEING_VISITED:
+                    path = [entry[0] for entry in stack]
+                    return path[path.index(nbr):]  # cycle found
+                if markers[nbr] == Markers.NOT_VISITED:
+                    markers[nbr] = Markers.BEING_VISITED
+                    stack.append((nbr, iter(graph[nbr])))
+                    break
+            else:
+                markers[node] = Markers.VISITED
+                stack.pop()
+    return None
+
+
+def find_shortest_cycle_undirected(graph: Dict[str, Set]) -> Optional[List]:
+    """
+    Find a shortest cycle (girth) of an undirected graph using a BFS from every node, O(V·(V + E))
+    In the BFS from a root, a non-tree edge (node -- nbr) closes a cycle of length dist[node] + dist[nbr] + 1 through
+    the BFS tree; the minimum over all roots is the girth (attained from any root on a shortest cycle, where the two
+    tree paths only meet at the root). Every BFS stops once no shorter cycle can be found from its root
+    """
+    best: Optional[List] = None
+    for root in graph:
+        if root in graph[root]:
+            return [root]  # self loop
+        dist: Dict[str, int] = {root: 0}
+        parents: Dict[str, Optional[str]] = {root: None}
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            if best is not None and 2 * dist[node] + 1 >= len(best):
+                break  # cycles closed from this level on cannot be shorter than the best one
+            for nbr in graph[node]:
+                if nbr not in dist:
+                    dist[nbr] = dist[node] + 1
+                    parents[nbr] = node
+                    queue.append(nbr)
+                elif nbr != parents[node] and (best is None or dist[node] + dist[nbr] + 1 < len(best)):
+                    best = _tree_path(parents, node)[::-1] + _tree_path(parents, nbr)[:-1]
+    return best
+
+
+def find_shortest_cycle_directed(graph: Dict[str, Set]) -> Optional[List]:
+    """
+    Find a shortest cycle of a directed graph using a BFS from every node, O(V·(V + E))
+    The shortest cycle through a root is the shortest path from the root to a node with an edge back to the root;
+    every BFS stops once no shorter cycle can be found from its root
+    """
+    best: Optional[List] = None
+    for root in graph:
+        dist: Dict[str, int] = {root: 0}
+        parents: Dict[str, Optional[str]] = {root: None}
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            if best is not None and dist[node] + 1 >= len(best):
+                break
+            for nbr in graph[node]:
+                if nbr == root:
+                    best = _tree_path(parents, node)[::-1]  # root -> ... -> node -> root
+                    break
+                if nbr not in dist:
+                    dist[nbr] = dist[node] + 1
+                    parents[nbr] = node
+                    queue.append(nbr)
+            else:
+                continue
+            break  # BFS settles nodes by distance, the first cycle found through the root is the shortest one
+    return best
+
+
+def _tree_path(parents: Dict[str, Optional[str]], node: str) -> List:
+    path = []
+    current: Optional[str] = node
+    while current is not None:
+        path.append(current)
+        current = parents[current]
+    return path  # node -> ... -> root
+
+
+def enumerate_cycles_directed(graph: Dict[str, Set], limit: Optional[int] = None) -> Iterator[List]:
+    """
+    Enumerate all elementary cycles (no repeated nodes) of a directed graph using Johnson's algorithm
+    Reference: Johnson, "Finding all the elementary circuits of a directed graph" (1975)
+
+    A graph can have exponentially many cycles, so cycles are generated lazily and at most `limit` of them are generated
+    (all if None); time is O((V + E)·(C + 1)) for C cycles.
+    1. Cycles never leave a strongly connected component, so the search runs inside every non-trivial SCC
+    2. All cycles through a start node of the SCC are found by a DFS from it, then the start node is removed and the SCCs
+       of the rest are searched again
+    3. A node is blocked while it is on the DFS path, and stays blocked after backtracking if no cycle was found through
+       it; it is unblocked (along with the nodes waiting on it) only once a cycle is found through one of its successors.
+       This is what makes every DFS branch lead to at least one cycle
+    """
+    if limit is not None and limit <= 0:
+        return
+    num_cycles = 0
+    components = [scc for scc in scc_tarjan(graph) if len(scc) > 1 or scc[0] in graph[scc[0]]]
+    while components:
+        component = set(components.pop())
+        subgraph = {node: graph[node] & component for node in component}
+        start = next(iter(component))
+
+        path = [start]
+        blocked = {start}
+        blocked_by: Dict[str, Set] = {node: set() for node in component}  # node -> nodes to unblock with it
+        closed: Set[str] = set()  # nodes on the path through which a cycle was found
+        stack = [(start, list(subgraph[start]))]
+        while stack:
+            node, nbrs = stack[-1]
+            if nbrs:
+                nbr = nbrs.pop()
+                if nbr == start:
+                    yield path[:]
+                    num_cycles += 1
+                    if num_cycles == limit:
+                        return
+                    closed.update(path)
+                elif nbr not in blocked:
+                    path.append(nbr)
+                    blocked.add(nbr)
+                    closed.discard(nbr)
+                    stack.append((nbr, list(subgraph[nbr])))
+                continue
+            # all neighbors of node explored, backtrack
+            if node in closed:
+                _unblock(node, blocked, blocked_by)
+            else:
+                for nbr in subgraph[node]:
+                    blocked_by[nbr].add(node)  # node may lead to a cycle again once nbr is unblocked
+            stack.pop()
+            path.pop()
+
+        del subgraph[start]
+        for node in subgraph:
+            subgraph[node].discard(start)
+        components.extend(scc for scc in scc_tarjan(subgraph) if len(scc) > 1 or scc[0] in subgraph[scc[0]])
+
+
+def _unblock(node: str, blocked: Set[str], blocked_by: Dict[str, Set]) -> None:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current in blocked:
+            blocked.remove(current)
+            stack.extend(blocked_by[current])
+            blocked_by[current].clear()
 
 
 if __name__ == '__main__':
@@ -107,21 +334,42 @@ if __name__ == '__main__':
 
     print("\n=> Find cycle in an Undirected Graph using Disjoint Set Union (Union-Find)")
     print("\n-> Undirected Cyclic Graph")
-    print("Found: {}".format(find_cycles_undirected_union_find(graph=undirected_cyclic_graph)))
+    print("Cycle: {}".format(find_cycles_undirected_union_find(graph=undirected_cyclic_graph)))
     print("\n-> Undirected Acyclic Graph")
-    print("Found: {}".format(find_cycles_undirected_union_find(graph=undirected_acyclic_graph)))
+    print("Cycle: {}".format(find_cycles_undirected_union_find(graph=undirected_acyclic_graph)))
 
     print("\n=> Find cycle in an Undirected Graph using DFS")
     print("\n-> Undirected Cyclic Graph")
-    print("Found: {}".format(find_cycles_undirected_dfs(graph=undirected_cyclic_graph)))
+    print("Cycle: {}".format(find_cycles_undirected_dfs(graph=undirected_cyclic_graph)))
     print("\n-> Undirected Acyclic Graph")
-    print("Found: {}".format(find_cycles_undirected_dfs(graph=undirected_acyclic_graph)))
+    print("Cycle: {}".format(find_cycles_undirected_dfs(graph=undirected_acyclic_graph)))
 
     print("\n=> Find cycle in a Directed Graph using DFS")
     print("\n-> Directed Cyclic Graph")
-    print("Found: {}".format(find_cycles_directed_dfs(graph=directed_cyclic_graph)))
+    print("Cycle: {}".format(find_cycles_directed_dfs(graph=directed_cyclic_graph)))
     print("\n-> Directed Acyclic Graph")
-    print("Found: {}".format(find_cycles_directed_dfs(graph=directed_acyclic_graph)))
+    print("Cycle: {}".format(find_cycles_directed_dfs(graph=directed_acyclic_graph)))
+
+    print("\n=> Find cycle in an Undirected Graph using iterative DFS")
+    print("\n-> Undirected Cyclic Graph")
+    print("Cycle: {}".format(find_cycles_undirected_dfs_iterative(graph=undirected_cyclic_graph)))
+    print("\n-> Undirected Acyclic Graph")
+    print("Cycle: {}".format(find_cycles_undirected_dfs_iterative(graph=undirected_acyclic_graph)))
 
+    print("\n=> Find cycle in a Directed Graph using iterative DFS")
+    print("\n-> Directed Cyclic Graph")
+    print("Cycle: {}".format(find_cycles_directed_dfs_iterative(graph=directed_cyclic_graph)))
+    print("\n-> Directed Acyclic Graph")
+    print("Cycle: {}".format(find_cycles_directed_dfs_iterative(graph=directed_acyclic_graph)))
 
+    print("\n=> Find a shortest cycle using BFS from every node")
+    print("\n-> Undirected Cyclic Graph")
+    print("Cycle: {}".format(find_shortest_cycle_undirected(graph=undirected_cyclic_graph)))
+    print("\n-> Directed Cyclic Graph")
+    print("Cycle: {}".format(find_shortest_cycle_directed(graph=directed_cyclic_graph)))
 
+    print("\n=> Enumerate all elementary cycles of a Directed Graph using Johnson's algorithm")
+    dense_directed_graph = {node: {nbr for nbr in 'ABCD' if nbr != node} for node in 'ABCD'}
+    print_graph(dense_directed_graph, message="\nComplete Directed Graph")
+    print("-> All {} cycles".format(len(list(enumerate_cycles_directed(dense_directed_graph)))))
+    print("-> First 5 cycles: {}".format(list(enumerate_cycles_directed(dense_directed_graph, limit=5))))
@@ -0,0 +1,106 @@
+from enum import Enum
+from typing import Dict, List, Sequence, Set, Tuple
+
+from unionfind.rollback import RollbackDisjointSetUnion
+
+
+class EdgeEvent(Enum):
+    ADD = 0  # add an undirected edge (u, v)
+    REMOVE = 1  # remove a previously added undirected edge (u, v)
+    QUERY = 2  # are u and v connected at this point in time?
+
+
+def offline_dynamic_connectivity(events: Sequence[Tuple[EdgeEvent, str, str]]) -> List[bool]:
+    """
+    Answer connectivity queries on an undirected graph over a timeline of edge insertions and deletions
+    Offline: the whole timeline of events must be known upfront. Returns the answers of all QUERY events in order
+
+    Disjoint Set Union handles edge insertions but not deletions. Instead of rebuilding it for every point in time:
+    1. Every edge is alive during a time interval [added, removed) of the timeline
+    2. A segment tree is built over the timeline, and every edge is stored in the O(log(T)) segment tree nodes whose
+       ranges exactly cover its alive interval
+    3. A DFS of the segment tree unions the edges of a node when entering it and rolls them back when leaving it, so on
+       reaching the leaf of time t, exactly the edges alive at time t have been unioned
+    Uses `RollbackDisjointSetUnion` (union-by-size, no path compression) to undo unions in O(1) each, for a total of
+    O(T·log(T)·log(n)) time for T events on n nodes
+    """
+    num_events = len(events)
+    answers: List[bool] = []
+    if num_events == 0:
+        return answers
+
+    # 1. alive intervals of every edge; an edge can be added multiple times (multigraph)
+    intervals: List[Tuple[int, int, str, str]] = []
+    added_at: Dict[Tuple[str, str], List[int]] = {}
+    nodes: Set[str] = set()
+    for t, (event, u, v) in enumerate(events):
+        nodes.update((u, v))
+        edge = (u, v) if u <= v else (v, u)
+        if event == EdgeEvent.ADD:
+            added_at.setdefault(edge, []).append(t)
+        elif event == EdgeEvent.REMOVE:
+            if not added_at.get(edge):
+                raise ValueError("Edge {} removed at time {} was never added".format(edge, t))
+            intervals.append((added_at[edge].pop(), t, u, v))
+    for (u, v), starts in added_at.items():
+        intervals.extend((start, num_events, u, v) for start in starts)  # edges never removed live till the end
+
+    # 2. segment tree over time [0, num_events), node i covers its children 2i and 2i+1
+    tree_edges: List[List[Tuple[str, str]]] = [[] for _ in range(4 * num_events)]
+
+    def _insert(idx: int, lo: int, hi: int, start: int, end: int, edge: Tuple[str, str]) -> None:
+        if end <= lo or hi <= start:
+            return
+        if start <= lo and hi <= end:
+            tree_edges[idx].append(edge)
+            return
+        mid = (lo + hi) // 2
+        _insert(2 * idx, lo, mid, start, end, edge)
+        _insert(2 * idx + 1, mid, hi, start, end, edge)
+
+    for start, end, u, v in intervals:
+        # the edge is applied right after the ADD event and stops right at the REMOVE event
+        _insert(1, 0, num_events, start + 1, end, (u, v))
+
+    # 3. DFS over the segment tree with union / rollback, recursion depth is only O(log(T))
+    dsu = RollbackDisjointSetUnion()
+    dsu.make_set(nodes)
+
+    def _dfs(idx: int, lo: int, hi: int) -> None:
+        snapshot = dsu.snapshot()
+        for u, v in tree_edges[idx]:
+            dsu.union_set(u, v)
+        if hi - lo == 1:
+            event, u, v = events[lo]
+            if event == EdgeEvent.QUERY:
+                answers.append(dsu.find_set(u) == dsu.find_set(v))
+        else:
+            mid = (lo + hi) // 2
+            _dfs(2 * idx, lo, mid)
+            _dfs(2 * idx + 1, mid, hi)
+        dsu.rollback(snapshot)
+
+    _dfs(1, 0, num_events)
+    return answers
+
+
+if __name__ == '__main__':
+    timeline = [
+        (EdgeEvent.ADD, 'A', 'B'),
+        (EdgeEvent.ADD, 'B', 'C'),
+        (EdgeEvent.QUERY, 'A', 'C'),  # True
+        (EdgeEvent.REMOVE, 'A', 'B'),
+        (EdgeEvent.QUERY, 'A', 'C'),  # False
+        (EdgeEvent.ADD, 'C', 'D'),
+        (EdgeEvent.ADD, 'D', 'A'),
+        (EdgeEvent.QUERY, 'A', 'B'),  # True, via A - D - C - B
+        (EdgeEvent.REMOVE, 'B', 'C'),
+        (EdgeEvent.QUERY, 'A', 'B'),  # False
+    ]
+
+    print("\nTimeline")
+    for event in timeline:
+        print("{} {} {}".format(event[0].name, event[1], event[2]))
+
+    print("\n=> Answers to connectivity queries")
+    print(offline_dynamic_connectivity(timeline))
@@ -0,0 +1,167 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from graph import Graph, SampleGraphs, CycleFoundError, print_graph
+from graph.topological_sorting import top_sort_dfs_iterative
+
+
+class DynamicTopoOrder:
+    """
+    Maintains a topological ordering of a directed acyclic graph under edge insertions and deletions
+    Reference: Pearce & Kelly, "A Dynamic Topological Sort Algorithm for Directed Acyclic Graphs" (2006)
+
+    Recomputing a topological sort after every edge insertion costs O(V + E) per insertion. Instead, every node keeps a
+    position in the current ordering and an inserted edge (u -> v) is handled as follows:
+    - if position(u) < position(v), the ordering is still valid and nothing needs to be done
+    - otherwise only the nodes between the two positions can be out of order (the affected region):
+        - forward DFS from v, only visiting nodes positioned before u; reaching u means the edge would close a cycle
+        - backward DFS from u, only visiting nodes positioned after v
+        - the nodes found by both searches are reassigned the same set of positions they already had, placing all
+          nodes reaching u (backward set) before all nodes reachable from v (forward set)
+    So an insertion costs time proportional to the affected region rather than the whole graph. Removing an edge can
+    never invalidate an ordering and takes O(1) time.
+    """
+    def __init__(self, graph: Optional[Graph] = None):
+        self._succs: Dict[str, Set[str]] = {}
+        self._preds: Dict[str, Set[str]] = {}
+        self._order: List[str] = []  # position -> node
+        self._positions: Dict[str, int] = {}  # node -> position
+        if graph is not None:
+            self._seed(graph)
+
+    def _seed(self, graph: Graph) -> None:
+        if not graph.is_directed:
+            raise ValueError("Topological ordering is only defined for directed graphs")
+        top_ordering = top_sort_dfs_iterative(graph.graph)
+        if top_ordering is None:
+            raise CycleFoundError("Graph is cyclic, topological sort not possible!")
+        self.add_nodes(top_ordering)
+        for node, nbrs in graph.graph.items():
+            self._succs[node].update(nbrs)
+            for nbr in nbrs:
+                self._preds[nbr].add(node)
+
+    def add_nodes(self, nodes: Iterable[str]) -> None:
+        """
+        Add new nodes without any edges at the end of the ordering; existing nodes are ignored
+        """
+        for node in nodes:
+            if node not in self._positions:
+                self._positions[node] = len(self._order)
+                self._order.append(node)
+                self._succs[node] = set()
+                self._preds[node] = set()
+
+    def add_edge(self, src: str, dst: str) -> None:
+        """
+        Add an edge src -> dst (adding missing nodes) and restore the topological ordering
+        Raises `CycleFoundError` and leaves the graph unchanged if the edge would close a cycle
+        """
+        if src == dst:
+            raise CycleFoundError("Edge {} -> {} is a self loop".format(src, dst))
+        # any other edge closing a cycle has both endpoints in the graph already, so no node is added for it either
+        self.add_nodes((src, dst))
+        if dst in self._succs[src]:
+            return
+
+        lower, upper = self._positions[dst], self._positions[src]
+        if lower < upper:
+            # dst is currently placed before src, reorder the affected region [lower, upper]
+            forward = self._forward_region(dst, upper, src)
+            backward = self._backward_region(src, lower)
+            self._reorder(backward, forward)
+
+        self._succs[src].add(dst)
+        self._preds[dst].add(src)
+
+    def remove_edge(self, src: str, dst: str) -> None:
+        """
+        Remove the edge src -> dst, the current ordering stays valid; raises `KeyError` if the edge does not exist
+        """
+        self._succs[src].remove(dst)
+        self._preds[dst].remove(src)
+
+    def _forward_region(self, start: str, upper: int, cycle_node: str) -> List[str]:
+        """
+        Nodes reachable from start that are positioned before `upper`
+        """
+        positions, succs = self._positions, self._succs
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nbr in succs[node]:
+                if nbr == cycle_node:
+                    raise CycleFoundError("Edge {} -> {} closes a cycle".format(cycle_node, start))
+                if nbr not in visited and positions[nbr] < upper:
+                    visited.add(nbr)
+                    stack.append(nbr)
+        return list(visited)
+
+    def _backward_region(self, start: str, lower: int) -> List[str]:
+        """
+        Nodes reaching start that are positioned after `lower`
+        """
+        positions, preds = self._positions, self._preds
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nbr in preds[node]:
+                if nbr not in visited and positions[nbr] > lower:
+                    visited.add(nbr)
+                    stack.append(nbr)
+        return list(visited)
+
+    def _reorder(self, backward: List[str], forward: List[str]) -> None:
+        positions = self._positions
+        backward.sort(key=positions.__getitem__)
+        forward.sort(key=positions.__getitem__)
+        nodes = backward + forward
+        slots = sorted(positions[node] for node in nodes)
+        for node, slot in zip(nodes, slots):
+            positions[node] = slot
+            self._order[slot] = node
+
+    def get_order(self) -> List[str]:
+        """
+        Get the current topological ordering of all nodes
+        """
+        return list(self._order)
+
+    def get_position(self, node: str) -> int:
+        """
+        Get the position of a node in the current topological ordering
+        """
+        return self._positions[node]
+
+    def __str__(self):
+        return "DynamicTopoOrder@{}\n-> Order: {}\n-> Total edges: {}".format(
+            id(self),
+            self._order,
+            sum(len(nbrs) for nbrs in self._succs.values())
+        )
+
+
+if __name__ == '__main__':
+    graph = SampleGraphs.directed_acyclic_disconn_graph()
+    print_graph(graph, message="\nDirected Acyclic Graph")
+
+    dto = DynamicTopoOrder(graph)
+    print("\n=> Initial ordering")
+    print(dto)
+
+    print("\nAdding edge {'H' -> 'A'}")
+    dto.add_edge('H', 'A')
+    print(dto)
+
+    print("\nAdding edge {'F' -> 'G'} which closes the cycle G -> H -> A -> C -> F -> G")
+    try:
+        dto.add_edge('F', 'G')
+    except CycleFoundError as ce:
+        print(ce)
+    print(dto)
+
+    print("\nRemoving edge {'H' -> 'A'} and adding edge {'F' -> 'G'}")
+    dto.remove_edge('H', 'A')
+    dto.add_edge('F', 'G')
+    print(dto)
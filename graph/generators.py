@@ -0,0 +1,143 @@
+import math
+import random
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from graph import Graph, print_graph
+
+"""
+Seeded synthetic graph generators, for testing and benchmarking the graph algorithms at scale
+
+Nodes are labelled '0', '1', ..., 'n-1' and every generator builds the adjacency directly in O(V + E) time, so graphs
+with millions of nodes take seconds to generate; the same seed always generates the same graph.
+"""
+
+
+def _random_pairs(num_nodes: int, edge_probability: float, rng: random.Random) -> Iterator[Tuple[int, int]]:
+    """
+    Every pair (u, v) with u < v independently with the given probability, in O(V + E) expected time
+    Instead of flipping a coin for each of the V^2 / 2 pairs, the number of pairs skipped until the next selected pair
+    is drawn from a geometric distribution (Batagelj & Brandes, "Efficient generation of large random networks", 2005)
+    """
+    if edge_probability <= 0:
+        return
+    log_q = math.log(1 - edge_probability) if edge_probability < 1 else None
+    v, u = 1, -1
+    while v < num_nodes:
+        u += 1 if log_q is None else 1 + int(math.log(1 - rng.random()) / log_q)
+        while u >= v and v < num_nodes:
+            u -= v
+            v += 1
+        if v < num_nodes:
+            yield u, v
+
+
+def _empty_adjacency(num_nodes: int) -> Dict[str, Set]:
+    return {str(i): set() for i in range(num_nodes)}
+
+
+def erdos_renyi_graph(num_nodes: int, edge_probability: float, is_directed: bool = False,
+                      seed: Optional[int] = None) -> Graph:
+    """
+    Erdős–Rényi random graph G(n, p): every possible edge is present independently with probability p
+    For directed graphs, both directions of every pair of nodes are drawn independently (no self loops)
+    Use edge_probability = average degree / num_nodes for sparse graphs of a given average degree
+    """
+    rng = random.Random(seed)
+    graph = _empty_adjacency(num_nodes)
+    for u, v in _random_pairs(num_nodes, edge_probability, rng):
+        graph[str(u)].add(str(v))
+        if not is_directed:
+            graph[str(v)].add(str(u))
+    if is_directed:
+        for u, v in _random_pairs(num_nodes, edge_probability, rng):  # independent draw of the reverse directions
+            graph[str(v)].add(str(u))
+    return Graph(graph=graph, is_directed=is_directed)
+
+
+def preferential_attachment_graph(num_nodes: int, edges_per_node: int, seed: Optional[int] = None) -> Graph:
+    """
+    Barabási–Albert power-law graph (undirected): every new node attaches to `edges_per_node` distinct existing nodes
+    chosen with probability proportional to their degree, giving a few hubs and a long tail of low degree nodes
+    Degree-proportional choices are uniform picks from a list holding every node once per incident edge
+    """
+    if not 1 <= edges_per_node < max(num_nodes, 2):
+        raise ValueError("Expected 1 <= edges_per_node < num_nodes, got {}".format(edges_per_node))
+    rng = random.Random(seed)
+    graph = _empty_adjacency(num_nodes)
+    targets = list(range(edges_per_node))  # the first new node attaches to all initial nodes
+    endpoints = []  # every node repeated once per incident edge
+    for node in range(edges_per_node, num_nodes):
+        for target in targets:
+            graph[str(node)].add(str(target))
+            graph[str(target)].add(str(node))
+        endpoints.extend(targets)
+        endpoints.extend([node] * edges_per_node)
+        chosen: Set[int] = set()
+        while len(chosen) < edges_per_node:
+            chosen.add(rng.choice(endpoints))
+        targets = list(chosen)
+    return Graph(graph=graph, is_directed=False)
+
+
+def random_dag(num_nodes: int, edge_probability: float, seed: Optional[int] = None) -> Graph:
+    """
+    Random directed acyclic graph: every edge of a random topological order of the nodes is present independently
+    with probability p, so the graph is acyclic but node labels carry no information about the order
+    """
+    rng = random.Random(seed)
+    order = [str(i) for i in range(num_nodes)]
+    rng.shuffle(order)
+    graph = _empty_adjacency(num_nodes)
+    for u, v in _random_pairs(num_nodes, edge_probability, rng):
+        graph[order[u]].add(order[v])
+    return Graph(graph=graph, is_directed=True)
+
+
+def chain_graph(num_nodes: int, is_directed: bool = True) -> Graph:
+    """
+    Chain (path graph) 0 -> 1 -> ... -> n-1, the worst case for recursion depth of depth-first searches
+    """
+    graph = _empty_adjacency(num_nodes)
+    for i in range(num_nodes - 1):
+        graph[str(i)].add(str(i + 1))
+        if not is_directed:
+            graph[str(i + 1)].add(str(i))
+    return Graph(graph=graph, is_directed=is_directed)
+
+
+def grid_graph(num_rows: int, num_cols: int) -> Graph:
+    """
+    Undirected 2D grid graph, node (row, col) is labelled str(row * num_cols + col) and connects to its (up to) 4
+    horizontal and vertical neighbors; large diameter with many short cycles
+    """
+    graph = _empty_adjacency(num_rows * num_cols)
+    for row in range(num_rows):
+        for col in range(num_cols):
+            node = row * num_cols + col
+            if col + 1 < num_cols:
+                graph[str(node)].add(str(node + 1))
+                graph[str(node + 1)].add(str(node))
+            if row + 1 < num_rows:
+                graph[str(node)].add(str(node + num_cols))
+                graph[str(node + num_cols)].add(str(node))
+    return Graph(graph=graph, is_directed=False)
+
+
+def complete_graph(num_nodes: int, is_directed: bool = False) -> Graph:
+    """
+    Complete graph, every node connects to every other node (n * (n - 1) adjacency entries, keep n small)
+    """
+    labels = [str(i) for i in range(num_nodes)]
+    graph = {node: set(labels) - {node} for node in labels}
+    return Graph(graph=graph, is_directed=is_directed)
+
+
+if __name__ == '__main__':
+    print_graph(erdos_renyi_graph(8, 0.3, seed=0), message="\nErdős–Rényi graph, n = 8, p = 0.3")
+    print_graph(erdos_renyi_graph(8, 0.3, is_directed=True, seed=0),
+                message="\nDirected Erdős–Rényi graph, n = 8, p = 0.3")
+    print_graph(preferential_attachment_graph(8, 2, seed=0), message="\nPreferential attachment graph, n = 8, m = 2")
+    print_graph(random_dag(8, 0.3, seed=0), message="\nRandom DAG, n = 8, p = 0.3")
+    print_graph(chain_graph(5), message="\nChain, n = 5")
+    print_graph(grid_graph(2, 3), message="\nGrid, 2 x 3")
+    print_graph(complete_graph(4), message="\nComplete graph, n = 4")
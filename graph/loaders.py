@@ -0,0 +1,192 @@
+import gzip
+from array import array
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from graph import Graph
+from graph.csr import CSRGraph
+
+"""
+Bulk loaders for edge list files (one edge per line) and adjacency list files (a node followed by its neighbors per
+line), eg: TSV files (delimiter=None, any whitespace) or CSV files (delimiter=','). Gzip compressed files are detected
+from their content and decompressed on the fly.
+
+Files are read in large chunks and every chunk is parsed with a few string operations over the whole chunk (split,
+slicing) when its lines are well-formed, so that the per-edge work happens inside the interpreter's C code instead of
+Python bytecode; chunks with comments, blank lines or extra columns are parsed line by line.
+"""
+
+
+def _open_text(path: str) -> TextIO:
+    with open(path, 'rb') as f:
+        is_gzip = f.read(2) == b'\x1f\x8b'
+    return gzip.open(path, 'rt') if is_gzip else open(path, 'r')  # type: ignore
+
+
+def _read_line_chunks(path: str, chunk_size: int) -> Iterator[str]:
+    """
+    Read a text file in chunks of about `chunk_size` characters, every chunk ending at a line boundary
+    """
+    with _open_text(path) as f:
+        remainder = ''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            end = chunk.rfind('\n')
+            if end == -1:
+                remainder += chunk  # no complete line in this chunk yet
+                continue
+            yield remainder + chunk[:end]
+            remainder = chunk[end + 1:]  # last line may be incomplete, carry it over to the next chunk
+        if remainder:
+            yield remainder
+
+
+def _split_edges(text: str, delimiter: Optional[str]) -> Tuple[List[str], List[str]]:
+    """
+    Parse the lines of a chunk into parallel lists of sources and destinations
+    """
+    text = text.replace('\r', '')
+    separator = delimiter
+    if separator is None:  # any whitespace, the fast path applies if a single kind of whitespace is used
+        separator = '\t' if ' ' not in text else ' ' if '\t' not in text else None
+    if separator is not None and '#' not in text and (separator == ' ' or ' ' not in text):
+        tokens = text.replace('\n', separator).split(separator)
+        sources, destinations = tokens[0::2], tokens[1::2]
+        # the lines rebuilt from the pairs are the original text only if every line has exactly two columns
+        if len(sources) == len(destinations) and '\n'.join(map(separator.join, zip(sources, destinations))) == text \
+                and (delimiter is not None or '' not in tokens):
+            return sources, destinations
+
+    sources, destinations = [], []
+    for line in text.split('\n'):
+        cols = line.split(delimiter)
+        if len(cols) >= 2 and not cols[0].startswith('#'):
+            sources.append(cols[0].strip())
+            destinations.append(cols[1].strip())
+    return sources, destinations
+
+
+def read_edge_list_chunks(path: str, delimiter: Optional[str] = None,
+                          chunk_size: int = 1 << 20) -> Iterator[Tuple[List[str], List[str]]]:
+    """
+    Lazily read an edge list file as chunks of edges, every chunk being a pair of parallel lists (sources, destinations)
+    Same file format as `read_edge_list`; memory used is bounded by the chunk size and not by the size of the file
+    """
+    for text in _read_line_chunks(path, chunk_size):
+        sources, destinations = _split_edges(text, delimiter)
+        if sources:
+            yield sources, destinations
+
+
+def read_edge_list(path: str, delimiter: Optional[str] = None, chunk_size: int = 1 << 20) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily read (source, destination) edges from an edge list file with one edge per line
+    - columns are split on `delimiter` (any whitespace by default); columns after the first two are ignored
+    - blank lines, lines with a single column and comment lines starting with '#' are skipped
+    - gzip compressed files are decompressed on the fly
+    The file is read in chunks of `chunk_size` characters, so memory used is bounded by the chunk size and not by the
+    size of the file
+    """
+    for sources, destinations in read_edge_list_chunks(path, delimiter=delimiter, chunk_size=chunk_size):
+        yield from zip(sources, destinations)
+
+
+def load_graph(path: str, delimiter: Optional[str] = None, is_directed: bool = False,
+               chunk_size: int = 1 << 20) -> Graph:
+    """
+    Load an edge list file into a `Graph` (adjacency `Dict[str, Set]`)
+    Every label is interned, i.e. all occurrences of a node share one string object instead of one copy per edge, and
+    the file is streamed chunk by chunk, so peak memory is the final adjacency plus one chunk
+    For undirected graphs, every edge is added in both directions
+    """
+    graph: Dict[str, Set] = {}
+    labels: Dict[str, str] = {}  # label -> interned label
+    for sources, destinations in read_edge_list_chunks(path, delimiter=delimiter, chunk_size=chunk_size):
+        for u, v in zip(sources, destinations):
+            u, v = labels.setdefault(u, u), labels.setdefault(v, v)
+            graph.setdefault(u, set()).add(v)
+            nbrs = graph.setdefault(v, set())
+            if not is_directed:
+                nbrs.add(u)
+    return Graph(graph=graph, is_directed=is_directed)
+
+
+def load_csr_graph(path: str, delimiter: Optional[str] = None, is_directed: bool = False,
+                   chunk_size: int = 1 << 20) -> CSRGraph:
+    """
+    Load an edge list file into a `CSRGraph`, the fast path for large files
+    1. Labels of every chunk are interned to integer ids, only labels new to the chunk are touched one by one; edge
+       endpoints are then mapped to ids and appended to two flat integer arrays (8 bytes per endpoint) in bulk
+    2. The edge arrays are sorted into CSR offsets and targets (`CSRGraph.from_edge_arrays`, vectorized with NumPy when
+       available); repeated edges are stored once
+    Node ids are assigned chunk by chunk, to the new sources of a chunk first and then to its new destinations
+    """
+    ids: Dict[str, int] = {}
+    sources, targets = array('l'), array('l')
+    for chunk_sources, chunk_destinations in read_edge_list_chunks(path, delimiter=delimiter, chunk_size=chunk_size):
+        new_labels = [label for label in dict.fromkeys(chunk_sources + chunk_destinations) if label not in ids]
+        ids.update(zip(new_labels, range(len(ids), len(ids) + len(new_labels))))
+        sources.extend(map(ids.__getitem__, chunk_sources))
+        targets.extend(map(ids.__getitem__, chunk_destinations))
+    if not is_directed:
+        sources, targets = sources + targets, targets + sources
+
+    csr = CSRGraph.from_edge_arrays(list(ids), sources, targets, is_directed=is_directed)
+    csr._ids = ids
+    return csr
+
+
+def load_adjacency_list(path: str, delimiter: Optional[str] = None, is_directed: bool = False,
+                        chunk_size: int = 1 << 20) -> Graph:
+    """
+    Load an adjacency list file into a `Graph`, every line being a node followed by all of its neighbors
+    (eg: "A B C" for edges A -> B and A -> C); a node without neighbors is a line with a single column
+    Blank lines and comment lines starting with '#' are skipped. For undirected graphs, a neighbor listed only on one
+    side is added in both directions
+    """
+    graph: Dict[str, Set] = {}
+    labels: Dict[str, str] = {}  # label -> interned label
+    for text in _read_line_chunks(path, chunk_size):
+        for line in text.split('\n'):
+            cols = [labels.setdefault(col, col) for col in (col.strip() for col in line.split(delimiter)) if col]
+            if not cols or cols[0].startswith('#'):
+                continue
+            node, nbrs = cols[0], cols[1:]
+            graph.setdefault(node, set()).update(nbrs)
+            for nbr in nbrs:
+                nbr_nbrs = graph.setdefault(nbr, set())
+                if not is_directed:
+                    nbr_nbrs.add(node)
+    return Graph(graph=graph, is_directed=is_directed)
+
+
+if __name__ == '__main__':
+    import os
+    import random
+    import tempfile
+    import time
+
+    from graph import print_graph
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'edges.tsv.gz')
+        num_nodes, num_edges = 100000, 1000000
+        rng = random.Random(0)
+        with gzip.open(path, 'wt') as f:
+            f.write("# source\tdestination\n")
+            for _ in range(num_edges):
+                f.write("{}\t{}\n".format(rng.randrange(num_nodes), rng.randrange(num_nodes)))
+
+        print("\n=> Loading a gzip compressed edge list of {} edges".format(num_edges))
+        start = time.perf_counter()
+        graph = load_graph(path)
+        print("-> load_graph: {} nodes in {:.2f}s".format(len(graph.graph), time.perf_counter() - start))
+        start = time.perf_counter()
+        csr_graph = load_csr_graph(path)
+        print("-> load_csr_graph: {} nodes in {:.2f}s".format(csr_graph.num_nodes, time.perf_counter() - start))
+
+        path = os.path.join(tmp_dir, 'adjacency.txt')
+        with open(path, 'w') as f:
+            f.write("A B C\nB D E\nC F\nG H\nI\n")
+        print_graph(load_adjacency_list(path, is_directed=True), message="\nDirected graph from an adjacency list")
@@ -0,0 +1,242 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from unionfind import UnionMethod
+from unionfind.array_backed import ArrayDisjointSetUnion, LabeledDisjointSetUnion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, edges are sorted with the built-in sort otherwise
+    np = None  # type: ignore
+
+"""
+A minimum spanning tree (MST) of a connected, undirected, weighted graph is a subset of edges connecting all nodes with
+the minimum possible total weight. For a disconnected graph, the union of the MSTs of all connected components is
+called the minimum spanning forest (MSF).
+"""
+
+
+class WeightedEdgeList:
+    """
+    Compact list of undirected weighted edges
+    Node labels are interned to dense integer ids and edges are stored column-wise in three flat arrays
+    (sources: array('l'), targets: array('l'), weights: array('d')), i.e. 24 bytes per edge instead of a Python tuple
+    of three objects per edge
+    """
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.labels: List[str] = []
+        self.sources = array('l')
+        self.targets = array('l')
+        self.weights = array('d')
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str, float]]) -> 'WeightedEdgeList':
+        edge_list = cls()
+        for u, v, weight in edges:
+            edge_list.add_edge(u, v, weight)
+        return edge_list
+
+    @classmethod
+    def from_dict(cls, graph: Dict[str, Dict[str, float]]) -> 'WeightedEdgeList':
+        """
+        Build from an undirected weighted adjacency {node: {nbr: weight}}, where every edge is present in both directions
+        """
+        edge_list = cls()
+        edge_list.add_nodes(graph.keys())
+        for node, nbrs in graph.items():
+            for nbr, weight in nbrs.items():
+                if node < nbr:  # bidirected edges in an undirected graph, only keep one of them
+                    edge_list.add_edge(node, nbr, weight)
+        return edge_list
+
+    def add_nodes(self, nodes: Iterable[str]) -> None:
+        for node in nodes:
+            self.node_id(node)
+
+    def add_edge(self, u: str, v: str, weight: float) -> None:
+        self.sources.append(self.node_id(u))
+        self.targets.append(self.node_id(v))
+        self.weights.append(weight)
+
+    def node_id(self, label: str) -> int:
+        """
+        Get the integer id of a node label, interning the label if it is new
+        """
+        node_id = self._ids.get(label)
+        if node_id is None:
+            node_id = self._ids[label] = len(self.labels)
+            self.labels.append(label)
+        return node_id
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.weights)
+
+    def edge(self, idx: int) -> Tuple[str, str, float]:
+        return self.labels[self.sources[idx]], self.labels[self.targets[idx]], self.weights[idx]
+
+    def sorted_edge_indices(self) -> Sequence[int]:
+        """
+        Edge indices sorted by weight (stable, ties keep insertion order)
+        Only the weights are sorted (key-extracted argsort), the edge arrays themselves are never rearranged
+        """
+        if np is not None:
+            return np.argsort(np.asarray(memoryview(self.weights)), kind='stable').tolist()
+        return sorted(range(self.num_edges), key=self.weights.__getitem__)
+
+
+def kruskal_msf(edges: WeightedEdgeList, presorted: bool = False) -> List[Tuple[str, str, float]]:
+    """
+    Find the minimum spanning forest using Kruskal's algorithm
+    1. Sort edges by weight (skipped if the edges were added in increasing order of weight, `presorted=True`)
+    2. Greedily accept an edge if its endpoints are in different components (Disjoint Set Union), i.e. it does not
+       create a cycle with the edges accepted so far
+    A spanning forest of n nodes has at most n - 1 edges, so scanning stops as soon as n - 1 edges are accepted
+    O(E·log(E)) for sorting plus O(E·⍺(V)) for the unions
+    """
+    num_nodes = edges.num_nodes
+    dsu = ArrayDisjointSetUnion(union_method=UnionMethod.BY_SIZE)
+    dsu.make_set(range(num_nodes))
+    order = range(edges.num_edges) if presorted else edges.sorted_edge_indices()
+
+    sources, targets, weights, labels = edges.sources, edges.targets, edges.weights, edges.labels
+    forest: List[Tuple[str, str, float]] = []
+    for idx in order:
+        if dsu.union_set(sources[idx], targets[idx]):
+            forest.append((labels[sources[idx]], labels[targets[idx]], weights[idx]))
+            if len(forest) == num_nodes - 1:
+                break  # spanning tree complete, remaining edges can only create cycles
+    return forest
+
+
+def kruskal_msf_stream(sorted_edges: Iterable[Tuple[str, str, float]],
+                       num_nodes: Optional[int] = None) -> List[Tuple[str, str, float]]:
+    """
+    Kruskal's algorithm over a stream of edges already sorted by weight (eg: read from a pre-sorted file)
+    Edges are consumed one by one and never stored; if the total number of nodes is known, the stream stops being
+    consumed as soon as num_nodes - 1 edges are accepted
+    """
+    dsu = LabeledDisjointSetUnion(union_method=UnionMethod.BY_SIZE)
+    forest: List[Tuple[str, str, float]] = []
+    for u, v, weight in sorted_edges:
+        dsu.make_set((u, v))
+        if dsu.union_set(u, v):
+            forest.append((u, v, weight))
+            if num_nodes is not None and len(forest) == num_nodes - 1:
+                break
+    return forest
+
+
+def boruvka_msf(edges: WeightedEdgeList, processes: int = 1) -> List[Tuple[str, str, float]]:
+    """
+    Find the minimum spanning forest using Borůvka's algorithm
+    In every round, find the cheapest edge leaving every component and add all of them to the forest at once; every
+    round at least halves the number of components, so there are O(log(V)) rounds of O(E) work each.
+    Ties are broken by edge index so that the cheapest edges of a round never form a cycle.
+
+    Finding the cheapest edges of a round is independent per edge, so with processes > 1 the edges are split into
+    chunks scanned by a pool of worker processes (each receiving the edge arrays once), and the per-chunk cheapest
+    edges are merged
+    """
+    num_nodes, num_edges = edges.num_nodes, edges.num_edges
+    dsu = ArrayDisjointSetUnion(union_method=UnionMethod.BY_SIZE)
+    dsu.make_set(range(num_nodes))
+    forest: List[Tuple[str, str, float]] = []
+
+    executor = None
+    if processes > 1 and num_edges > 0:  # without edges, every node is a tree of the forest as is
+        init_args = (edges.sources, edges.targets, edges.weights)
+        executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=init_args)
+    try:
+        while len(forest) < num_nodes - 1:
+            comps = array('l', dsu.find_many(range(num_nodes))) if num_nodes else array('l')
+            if executor is not None:
+                chunk_size = -(-num_edges // processes)  # ceil division
+                ranges = [(lo, min(lo + chunk_size, num_edges)) for lo in range(0, num_edges, chunk_size)]
+                cheapest: Dict[int, int] = {}
+                for chunk_cheapest in executor.map(_cheapest_edges_in_worker, [comps] * len(ranges), ranges):
+                    _merge_cheapest(cheapest, chunk_cheapest, edges.weights)
+            else:
+                cheapest = _cheapest_edges(edges.sources, edges.targets, edges.weights, comps, 0, num_edges)
+
+            if not cheapest:
+                break  # no edges leave any component, the remaining components are disconnected
+            for idx in set(cheapest.values()):
+                if dsu.union_set(edges.sources[idx], edges.targets[idx]):
+                    forest.append(edges.edge(idx))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return forest
+
+
+def _cheapest_edges(sources: Sequence[int], targets: Sequence[int], weights: Sequence[float], comps: Sequence[int],
+                    lo: int, hi: int) -> Dict[int, int]:
+    """
+    Cheapest edge (by weight, then by index) leaving every component, among the edges [lo, hi)
+    """
+    cheapest: Dict[int, int] = {}
+    for idx in range(lo, hi):
+        comp_u, comp_v = comps[sources[idx]], comps[targets[idx]]
+        if comp_u == comp_v:
+            continue
+        weight = weights[idx]
+        for comp in (comp_u, comp_v):
+            best = cheapest.get(comp)
+            if best is None or weight < weights[best]:
+                cheapest[comp] = idx
+    return cheapest
+
+
+def _merge_cheapest(cheapest: Dict[int, int], chunk_cheapest: Dict[int, int], weights: Sequence[float]) -> None:
+    for comp, idx in chunk_cheapest.items():
+        best = cheapest.get(comp)
+        if best is None or (weights[idx], idx) < (weights[best], best):
+            cheapest[comp] = idx
+
+
+_worker_edges: Tuple[Sequence[int], Sequence[int], Sequence[float]] = (array('l'), array('l'), array('d'))
+
+
+def _init_worker(sources: Sequence[int], targets: Sequence[int], weights: Sequence[float]) -> None:
+    global _worker_edges
+    _worker_edges = (sources, targets, weights)
+
+
+def _cheapest_edges_in_worker(comps: Sequence[int], edge_range: Tuple[int, int]) -> Dict[int, int]:
+    sources, targets, weights = _worker_edges
+    return _cheapest_edges(sources, targets, weights, comps, edge_range[0], edge_range[1])
+
+
+if __name__ == '__main__':
+    weighted_graph_edges = [
+        ('A', 'B', 4.0), ('A', 'C', 1.0), ('B', 'C', 2.0), ('B', 'D', 5.0),
+        ('C', 'D', 8.0), ('C', 'E', 10.0), ('D', 'E', 2.0), ('D', 'F', 6.0),
+        ('E', 'F', 3.0), ('G', 'H', 1.0)
+    ]
+    edge_list = WeightedEdgeList.from_edges(weighted_graph_edges)
+
+    print("\nWeighted Edges")
+    print(weighted_graph_edges)
+
+    print("\n=> Minimum Spanning Forest using Kruskal's algorithm")
+    kruskal_forest = kruskal_msf(edge_list)
+    print(kruskal_forest)
+    print("Total weight: {}".format(sum(w for _, _, w in kruskal_forest)))
+
+    print("\n=> Minimum Spanning Forest using Kruskal's algorithm on a pre-sorted stream of edges")
+    print(kruskal_msf_stream(sorted(weighted_graph_edges, key=lambda e: e[2]), num_nodes=8))
+
+    print("\n=> Minimum Spanning Forest using Borůvka's algorithm")
+    boruvka_forest = boruvka_msf(edge_list)
+    print(boruvka_forest)
+    print("Total weight: {}".format(sum(w for _, _, w in boruvka_forest)))
+
+    print("\n=> Minimum Spanning Forest using Borůvka's algorithm with a process pool")
+    print(boruvka_msf(edge_list, processes=2))
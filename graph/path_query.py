@@ -0,0 +1,171 @@
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from graph import Graph, SampleGraphs, print_graph
+from graph.csr import CSRGraph
+
+_NOT_VISITED = -1
+
+
+class _SourceSearch:
+    """
+    A resumable BFS from a single source node over the integer ids of a CSR graph
+    Parent pointers and the BFS queue are kept between queries, so a later query from the same source continues the
+    search from where the previous one stopped instead of starting over
+    """
+    __slots__ = ('source_id', 'parents', 'queue', 'head')
+
+    def __init__(self, source_id: int, num_nodes: int):
+        self.source_id = source_id
+        self.parents = array('l', [_NOT_VISITED]) * num_nodes  # also serves as the visited set
+        self.parents[source_id] = source_id
+        self.queue = array('l', [source_id])
+        self.head = 0  # queue is never popped, nodes before `head` are already expanded
+
+    def search(self, offsets: Sequence[int], targets: Sequence[int], goal_id: int) -> Optional[List[int]]:
+        """
+        Expand the BFS until goal node is discovered (or the search is exhausted) and return the path of node ids
+        """
+        parents, queue = self.parents, self.queue
+        head = self.head
+        while parents[goal_id] == _NOT_VISITED and head < len(queue):
+            node_id = queue[head]
+            head += 1
+            for nbr_id in targets[offsets[node_id]:offsets[node_id + 1]]:
+                if parents[nbr_id] == _NOT_VISITED:
+                    parents[nbr_id] = node_id
+                    queue.append(nbr_id)
+        self.head = head
+
+        if parents[goal_id] == _NOT_VISITED:
+            return None
+        path = [goal_id]
+        while path[-1] != self.source_id:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+
+class PathQueryEngine:
+    """
+    Answers batches of shortest path (minimum hops) queries against a single graph
+
+    Every call to `bfs_paths_optimized` builds a new visited set and queue and walks the `Dict[str, Set]` adjacency.
+    The engine instead converts the graph to a `CSRGraph` once and answers queries over integer node ids:
+    - queries in a batch are grouped by their start node, so all goals sharing a source are answered by one BFS
+    - the BFS of a source is resumable; it only expands as far as the farthest goal asked for so far
+    - searches of the most recently used sources are kept in an LRU cache and reused across batches
+    - distinct sources of a batch can be fanned out to a pool of worker processes, each holding a copy of the CSR graph
+
+    Each cached search holds a parent array of one machine word per node, so `cache_size` bounds the memory used.
+    """
+    def __init__(self, graph: Union[Graph, CSRGraph], cache_size: int = 32):
+        self._graph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        self._cache_size = cache_size
+        self._searches: 'OrderedDict[int, _SourceSearch]' = OrderedDict()
+
+    def shortest_path(self, start: str, goal: str) -> Optional[List]:
+        """
+        Find shortest path from start node to goal node; returns None if either node is not in the graph or the goal
+        node is not reachable
+        """
+        return self.shortest_paths([(start, goal)])[0]
+
+    def shortest_paths(self, queries: Iterable[Tuple[str, str]], processes: int = 1) -> List[Optional[List]]:
+        """
+        Find shortest paths for a batch of (start, goal) queries, results are returned in the order of the queries
+        The result of a query is None if either node is not in the graph or the goal node is not reachable
+        With processes > 1, the distinct start nodes of the batch are split across a pool of worker processes; this only
+        pays off for large batches as every worker receives its own copy of the graph
+        """
+        graph = self._graph
+        queries_by_source: Dict[int, List[Tuple[int, int]]] = {}  # source id -> [(query index, goal id)]
+        results: List[Optional[List]] = []
+        for idx, (start, goal) in enumerate(queries):
+            results.append(None)
+            if start in graph and goal in graph:
+                queries_by_source.setdefault(graph.node_id(start), []).append((idx, graph.node_id(goal)))
+
+        if processes > 1 and len(queries_by_source) > 1:
+            id_paths = self._search_in_pool(queries_by_source, processes)
+        else:
+            id_paths = self._search(queries_by_source)
+
+        labels = graph.labels
+        for idx, id_path in id_paths:
+            if id_path is not None:
+                results[idx] = [labels[node_id] for node_id in id_path]
+        return results
+
+    def _search(self, queries_by_source: Dict[int, List[Tuple[int, int]]]) -> List[Tuple[int, Optional[List[int]]]]:
+        offsets, targets = self._graph.offsets, self._graph.targets
+        id_paths = []
+        for source_id, goals in queries_by_source.items():
+            search = self._get_search(source_id)
+            for idx, goal_id in goals:
+                id_paths.append((idx, search.search(offsets, targets, goal_id)))
+        return id_paths
+
+    def _get_search(self, source_id: int) -> _SourceSearch:
+        search = self._searches.get(source_id)
+        if search is None:
+            search = _SourceSearch(source_id, self._graph.num_nodes)
+            self._searches[source_id] = search
+            if len(self._searches) > self._cache_size:
+                self._searches.popitem(last=False)  # evict least recently used search
+        else:
+            self._searches.move_to_end(source_id)
+        return search
+
+    def _search_in_pool(self, queries_by_source: Dict[int, List[Tuple[int, int]]],
+                        processes: int) -> List[Tuple[int, Optional[List[int]]]]:
+        sources = list(queries_by_source.items())
+        chunk_size = -(-len(sources) // processes)  # ceil division
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        init_args = (self._graph.offsets, self._graph.targets, self._graph.num_nodes)
+        id_paths = []
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=init_args) as executor:
+            for chunk_paths in executor.map(_search_chunk, chunks):
+                id_paths.extend(chunk_paths)
+        return id_paths
+
+
+# ----- Process pool workers -----
+
+_worker_graph: Tuple[Sequence[int], Sequence[int], int] = (array('l'), array('l'), 0)
+
+
+def _init_worker(offsets: Sequence[int], targets: Sequence[int], num_nodes: int) -> None:
+    global _worker_graph
+    _worker_graph = (offsets, targets, num_nodes)
+
+
+def _search_chunk(chunk: List[Tuple[int, List[Tuple[int, int]]]]) -> List[Tuple[int, Optional[List[int]]]]:
+    offsets, targets, num_nodes = _worker_graph
+    id_paths = []
+    for source_id, goals in chunk:
+        search = _SourceSearch(source_id, num_nodes)
+        for idx, goal_id in goals:
+            id_paths.append((idx, search.search(offsets, targets, goal_id)))
+    return id_paths
+
+
+if __name__ == '__main__':
+    graph = SampleGraphs.directed_cyclic_disconn_graph()
+    queries = [('A', 'F'), ('A', 'E'), ('A', 'G'), ('B', 'C'), ('G', 'H'), ('D', 'D')]
+
+    print_graph(graph, message="\nGraph")
+    print("\nQueries")
+    print(queries)
+
+    engine = PathQueryEngine(graph)
+
+    print("\n=> Shortest paths for a batch of queries")
+    for query, path in zip(queries, engine.shortest_paths(queries)):
+        print("{} -> {}".format(query, path))
+
+    print("\n=> Shortest paths for a batch of queries using a process pool")
+    for query, path in zip(queries, engine.shortest_paths(queries, processes=2)):
+        print("{} -> {}".format(query, path))
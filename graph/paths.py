@@ -1,6 +1,6 @@
 from collections import deque
 from typing import Dict, Set, List, Optional
-from graph import SampleGraphs, print_graph
+from graph import SampleGraphs, print_graph, reverse_graph
 
 
 def dfs_paths(graph: Dict[str, Set], start: str, goal: str) -> Optional[List]:
@@ -58,6 +58,123 @@ def bfs_paths_optimized(graph: Dict[str, Set], start: str, goal: str) -> Optiona
     return None
 
 
+def _build_path(parents: Dict[str, Optional[str]], goal: str) -> List:
+    """
+    Rebuild the path from the start node to goal node by following the parent pointers back from the goal
+    """
+    path = []
+    node: Optional[str] = goal
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
+
+
+def dfs_paths_parent_pointers(graph: Dict[str, Set], start: str, goal: str) -> Optional[List]:
+    """
+    Find path from start node to goal node using DFS and a single map of parent pointers
+    Works for all types of graphs {directed, undirected, cyclic, acyclic}
+
+    `dfs_paths` stores a copy of the path so far with every stack entry, so both time and memory grow quadratically with
+    the length of the path. Here every discovered node only stores its parent (the node it was discovered from) and the
+    path is rebuilt once, after the goal is found, in O(path length)
+    """
+    parents: Dict[str, Optional[str]] = {start: None}  # also serves as the visited set
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            return _build_path(parents, goal)
+        for nbr in graph[node]:
+            if nbr not in parents:
+                parents[nbr] = node
+                stack.append(nbr)
+    print("Path from start node: '{}' to goal node: '{}' not found in graph".format(start, goal))
+    return None
+
+
+def bfs_paths_parent_pointers(graph: Dict[str, Set], start: str, goal: str) -> Optional[List]:
+    """
+    Find shortest path (minimum hops) from start node to goal node using optimized BFS and a single map of parent pointers
+    Works for all types of graphs {directed, undirected, cyclic, acyclic}
+    Same as `bfs_paths_optimized` but queue entries are just nodes, the path is rebuilt from the parent pointers only
+    once the goal is found
+    """
+    if start == goal:
+        return [start]
+    parents: Dict[str, Optional[str]] = {start: None}  # also serves as the visited set
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for nbr in graph[node]:
+            if nbr not in parents:
+                parents[nbr] = node
+                if nbr == goal:
+                    return _build_path(parents, goal)
+                queue.append(nbr)
+    print("Path from start node: '{}' to goal node: '{}' not found in graph".format(start, goal))
+    return None
+
+
+def bfs_paths_bidirectional(graph: Dict[str, Set], start: str, goal: str, is_directed: bool = False,
+                            reversed_graph: Optional[Dict[str, Set]] = None) -> Optional[List]:
+    """
+    Find shortest path (minimum hops) from start node to goal node using bidirectional BFS
+    Works for all types of graphs {directed, undirected, cyclic, acyclic}
+
+    Two BFS searches are run, one forward from the start node and one backward from the goal node, always expanding one
+    full level of the side with the smaller frontier. The search stops as soon as the two sides meet. If the graph has an
+    average branching factor of b and the shortest path has d hops, a single BFS visits O(b^d) nodes while the two
+    searches together only visit O(b^(d/2)) nodes.
+
+    The backward search walks edges in reverse. For an undirected graph (is_directed=False) the graph itself is used.
+    For a directed graph (is_directed=True), the reversed adjacency is `reversed_graph` if given, ideally computed once
+    with `reverse_graph(graph)` and reused across queries, otherwise it is built by this call in O(V + E).
+
+    Why the first meeting point gives a shortest path: before a level is expanded, no node is visited by both sides,
+    so the shortest path has more than (forward depth + backward depth) hops; expanding one more level and meeting
+    gives a path of exactly (forward depth + 1 + backward depth) hops at most, which must then be the shortest.
+    """
+    if start == goal:
+        return [start]
+    if reversed_graph is None:
+        # edges of an undirected graph can be walked backwards as is
+        reversed_graph = reverse_graph(graph) if is_directed else graph
+
+    fwd_parents: Dict[str, Optional[str]] = {start: None}
+    bwd_parents: Dict[str, Optional[str]] = {goal: None}  # parent pointers towards the goal node
+    fwd_frontier, bwd_frontier = [start], [goal]
+    while fwd_frontier and bwd_frontier:
+        # expand the smaller frontier
+        if len(fwd_frontier) <= len(bwd_frontier):
+            adjacency, parents, other_parents, frontier = graph, fwd_parents, bwd_parents, fwd_frontier
+        else:
+            adjacency, parents, other_parents, frontier = reversed_graph, bwd_parents, fwd_parents, bwd_frontier
+
+        next_frontier = []
+        for node in frontier:
+            for nbr in adjacency[node]:
+                if nbr not in parents:
+                    parents[nbr] = node
+                    if nbr in other_parents:
+                        # both searches met at nbr: start -> ... -> nbr -> ... -> goal
+                        path = _build_path(fwd_parents, nbr)
+                        node_to_goal = bwd_parents[nbr]
+                        while node_to_goal is not None:
+                            path.append(node_to_goal)
+                            node_to_goal = bwd_parents[node_to_goal]
+                        return path
+                    next_frontier.append(nbr)
+
+        if parents is fwd_parents:
+            fwd_frontier = next_frontier
+        else:
+            bwd_frontier = next_frontier
+    print("Path from start node: '{}' to goal node: '{}' not found in graph".format(start, goal))
+    return None
+
+
 if __name__ == '__main__':
     undirected_graph = SampleGraphs.undirected_cyclic_conn_graph().graph
     directed_graph = SampleGraphs.directed_cyclic_conn_graph().graph
@@ -92,3 +209,19 @@ if __name__ == '__main__':
     print("\n-> Disconnected Graph")
     print(bfs_paths(disconnected_graph, start_node, unreachable_goal_node))
 
+    print("\n=> BFS Paths using parent pointers")
+    print("\n-> Undirected Graph")
+    print(bfs_paths_parent_pointers(undirected_graph, start_node, goal_node))
+    print("\n-> Directed Graph")
+    print(bfs_paths_parent_pointers(directed_graph, start_node, goal_node))
+    print("\n-> Disconnected Graph")
+    print(bfs_paths_parent_pointers(disconnected_graph, start_node, unreachable_goal_node))
+
+    print("\n=> Bidirectional BFS Paths")
+    print("\n-> Undirected Graph")
+    print(bfs_paths_bidirectional(undirected_graph, start_node, goal_node))
+    print("\n-> Directed Graph")
+    print(bfs_paths_bidirectional(directed_graph, start_node, goal_node, is_directed=True))
+    print("\n-> Disconnected Graph")
+    print(bfs_paths_bidirectional(disconnected_graph, start_node, unreachable_goal_node, is_directed=True,
+                                  reversed_graph=reverse_graph(disconnected_graph)))
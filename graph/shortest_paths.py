@@ -0,0 +1,210 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from graph import SampleGraphs, print_graph
+
+
+class IndexedMinHeap:
+    """
+    Binary min-heap of keys with priorities that supports decrease-key
+
+    `heapq` based Dijkstra implementations push a duplicate entry every time a node's distance improves and skip the
+    stale entries when they are popped (lazy deletion), so the heap can grow up to O(E) entries. Here the heap keeps the
+    position of every key in the heap array, so the priority of a key already in the heap is decreased in place by
+    sifting it up in O(log(n)); every key is in the heap at most once, bounding its size by the number of keys in it
+    (the frontier for graph searches)
+    """
+    def __init__(self):
+        self._keys: List[str] = []
+        self._priorities: List[float] = []
+        self._positions: Dict[str, int] = {}
+
+    def push(self, key: str, priority: float) -> None:
+        """
+        Add a key, or decrease its priority if the key is already in the heap with a higher priority
+        """
+        pos = self._positions.get(key)
+        if pos is None:
+            pos = len(self._keys)
+            self._keys.append(key)
+            self._priorities.append(priority)
+            self._positions[key] = pos
+        elif priority < self._priorities[pos]:
+            self._priorities[pos] = priority
+        else:
+            return
+        self._sift_up(pos)
+
+    def pop(self) -> Tuple[str, float]:
+        """
+        Remove and return the key with the minimum priority along with its priority
+        """
+        key, priority = self._keys[0], self._priorities[0]
+        last_key, last_priority = self._keys.pop(), self._priorities.pop()
+        del self._positions[key]
+        if self._keys:
+            self._keys[0], self._priorities[0] = last_key, last_priority
+            self._positions[last_key] = 0
+            self._sift_down(0)
+        return key, priority
+
+    def peek(self) -> Tuple[str, float]:
+        return self._keys[0], self._priorities[0]
+
+    def _sift_up(self, pos: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        key, priority = keys[pos], priorities[pos]
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if priorities[parent] <= priority:
+                break
+            keys[pos], priorities[pos] = keys[parent], priorities[parent]
+            positions[keys[pos]] = pos
+            pos = parent
+        keys[pos], priorities[pos] = key, priority
+        positions[key] = pos
+
+    def _sift_down(self, pos: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        size = len(keys)
+        key, priority = keys[pos], priorities[pos]
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            keys[pos], priorities[pos] = keys[child], priorities[child]
+            positions[keys[pos]] = pos
+            pos = child
+        keys[pos], priorities[pos] = key, priority
+        positions[key] = pos
+
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _build_path(parents: Dict[str, Optional[str]], goal: str) -> List:
+    path = []
+    node: Optional[str] = goal
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
+
+
+def dijkstra(graph: Dict[str, Dict[str, float]], sources: Iterable[str], goal: Optional[str] = None,
+             heuristic: Optional[Callable[[str], float]] = None) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """
+    Dijkstra's algorithm from one or more source nodes, for graphs with non-negative edge weights
+    Works for both directed and undirected weighted graphs {cyclic, acyclic, connected, disconnected}
+
+    Returns (distances, parents) of all nodes settled by the search; parents point back along a shortest path towards
+    the nearest source (multi-source mode: all sources start at distance 0, so every node is assigned to its nearest
+    source). If a goal is given, the search stops as soon as the goal is settled
+
+    With a heuristic, this is A*: nodes are settled in order of distance + heuristic(node). The heuristic must be
+    consistent (never overestimate the weight of an edge plus the heuristic of its endpoint) for the first settled
+    path to the goal to be a shortest path
+
+    The frontier lives in an `IndexedMinHeap` with a true decrease-key, so its size never exceeds the number of
+    discovered but not yet settled nodes
+    """
+    h = heuristic or (lambda node: 0.0)
+    distances: Dict[str, float] = {}  # tentative distances of discovered nodes, final once settled
+    parents: Dict[str, Optional[str]] = {}
+    settled = set()
+    frontier = IndexedMinHeap()
+    for source in sources:
+        distances[source] = 0.0
+        parents[source] = None
+        frontier.push(source, h(source))
+
+    while frontier:
+        node, _ = frontier.pop()
+        settled.add(node)
+        if node == goal:
+            break
+        dist = distances[node]
+        for nbr, weight in graph[node].items():
+            if weight < 0:
+                raise ValueError("Negative edge weight {} -> {}: {}".format(node, nbr, weight))
+            if nbr in settled:
+                continue
+            nbr_dist = dist + weight
+            if nbr_dist < distances.get(nbr, float('inf')):
+                distances[nbr] = nbr_dist
+                parents[nbr] = node
+                frontier.push(nbr, nbr_dist + h(nbr))  # decrease-key if nbr is already in the frontier
+
+    return ({node: distances[node] for node in settled},
+            {node: parents[node] for node in settled})
+
+
+def dijkstra_path(graph: Dict[str, Dict[str, float]], start: str, goal: str) -> Optional[Tuple[List, float]]:
+    """
+    Find a shortest weighted path from start node to goal node using Dijkstra's algorithm, returns (path, distance)
+    """
+    distances, parents = dijkstra(graph, [start], goal=goal)
+    if goal not in distances:
+        print("Path from start node: '{}' to goal node: '{}' not found in graph".format(start, goal))
+        return None
+    return _build_path(parents, goal), distances[goal]
+
+
+def dijkstra_multi_source_path(graph: Dict[str, Dict[str, float]], sources: Iterable[str],
+                               goal: str) -> Optional[Tuple[List, float]]:
+    """
+    Find a shortest weighted path to goal node from the nearest of multiple source nodes, returns (path, distance)
+    """
+    distances, parents = dijkstra(graph, sources, goal=goal)
+    if goal not in distances:
+        print("Path to goal node: '{}' not found in graph from any source node".format(goal))
+        return None
+    return _build_path(parents, goal), distances[goal]
+
+
+def a_star_path(graph: Dict[str, Dict[str, float]], start: str, goal: str,
+                heuristic: Callable[[str], float]) -> Optional[Tuple[List, float]]:
+    """
+    Find a shortest weighted path from start node to goal node using A* search with a pluggable heuristic (an estimate
+    of the remaining distance from a node to the goal), returns (path, distance)
+    A good heuristic steers the search towards the goal so that far fewer nodes are settled than with Dijkstra's
+    algorithm; a heuristic of 0 for every node makes A* identical to Dijkstra's algorithm
+    """
+    distances, parents = dijkstra(graph, [start], goal=goal, heuristic=heuristic)
+    if goal not in distances:
+        print("Path from start node: '{}' to goal node: '{}' not found in graph".format(start, goal))
+        return None
+    return _build_path(parents, goal), distances[goal]
+
+
+if __name__ == '__main__':
+    undirected_graph = SampleGraphs.weighted_undirected_conn_graph().graph
+    directed_graph = SampleGraphs.weighted_directed_disconn_graph().graph
+
+    print_graph(undirected_graph, message="\nWeighted Undirected Graph")
+    print_graph(directed_graph, message="\nWeighted Directed Disconnected Graph")
+
+    print("\n=> Dijkstra's algorithm, distances from 'A'")
+    print(dijkstra(undirected_graph, ['A'])[0])
+
+    print("\n=> Dijkstra's algorithm, shortest path")
+    print("\n-> Undirected Graph")
+    print(dijkstra_path(undirected_graph, 'A', 'F'))
+    print("\n-> Directed Graph")
+    print(dijkstra_path(directed_graph, 'A', 'E'))
+    print("\n-> Directed Disconnected Graph")
+    print(dijkstra_path(directed_graph, 'A', 'G'))
+
+    print("\n=> Dijkstra's algorithm, shortest path from the nearest of 'A' and 'D'")
+    print(dijkstra_multi_source_path(undirected_graph, ['A', 'D'], 'F'))
+
+    print("\n=> A* search with a heuristic of number of hops to 'F' times the minimum edge weight")
+    hops_to_goal = {'A': 3, 'B': 2, 'C': 2, 'D': 1, 'E': 1, 'F': 0}
+    print(a_star_path(undirected_graph, 'A', 'F', heuristic=lambda node: hops_to_goal[node] * 1.0))
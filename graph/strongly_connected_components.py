@@ -0,0 +1,156 @@
+from typing import Dict, List, Set, Tuple
+
+from graph import Graph, SampleGraphs, print_graph, reverse_graph
+from graph.topological_sorting import top_sort_dfs_iterative
+
+"""
+A strongly connected component (SCC) of a directed graph is a maximal set of nodes such that every node is reachable from
+every other node in the set. Contracting every SCC into a single node gives the condensation of the graph, which is
+always a directed acyclic graph (DAG); a directed graph is acyclic if and only if all of its SCCs are single nodes.
+
+Both implementations below run in O(V + E) time and use explicit stacks instead of recursion, so they work for graphs
+with paths much longer than the recursion limit.
+"""
+
+
+def scc_tarjan(graph: Dict[str, Set]) -> List[List]:
+    """
+    Find strongly connected components using Tarjan's algorithm (single DFS pass)
+    - every node gets a discovery index and a low-link: the smallest index reachable through its DFS subtree using at
+      most one edge to a node that is still on the SCC stack
+    - when a node finishes with low-link == index, it is the root of an SCC made up of all nodes above it on the SCC stack
+    Components are returned in reverse topological order of the condensation (sinks first); the first member of every
+    component is its root
+    """
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    scc_stack: List[str] = []
+    sccs: List[List] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        scc_stack.append(root)
+        on_stack.add(root)
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, nbrs = stack[-1]
+            for nbr in nbrs:
+                if nbr not in index:
+                    index[nbr] = low[nbr] = len(index)
+                    scc_stack.append(nbr)
+                    on_stack.add(nbr)
+                    stack.append((nbr, iter(graph[nbr])))
+                    break  # descend into nbr
+                elif nbr in on_stack and index[nbr] < low[node]:
+                    low[node] = index[nbr]
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    # node is the root of an SCC, pop the whole component from the SCC stack
+                    scc = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.remove(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    scc.reverse()
+                    sccs.append(scc)
+    return sccs
+
+
+def scc_kosaraju(graph: Dict[str, Set]) -> List[List]:
+    """
+    Find strongly connected components using Kosaraju's algorithm (two DFS passes)
+    1. Compute the DFS finishing order of the graph
+    2. In the reversed graph, run DFS from nodes in decreasing order of finishing time; every DFS tree is an SCC
+    Components are returned in topological order of the condensation (sources first)
+    """
+    finish_order: List[str] = []
+    visited: Set[str] = set()
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, nbrs = stack[-1]
+            for nbr in nbrs:
+                if nbr not in visited:
+                    visited.add(nbr)
+                    stack.append((nbr, iter(graph[nbr])))
+                    break
+            else:
+                finish_order.append(node)
+                stack.pop()
+
+    reversed_graph = reverse_graph(graph)
+    sccs: List[List] = []
+    assigned: Set[str] = set()
+    for root in reversed(finish_order):
+        if root in assigned:
+            continue
+        assigned.add(root)
+        scc = [root]
+        dfs_stack = [root]
+        while dfs_stack:
+            node = dfs_stack.pop()
+            for nbr in reversed_graph[node]:
+                if nbr not in assigned:
+                    assigned.add(nbr)
+                    scc.append(nbr)
+                    dfs_stack.append(nbr)
+        sccs.append(scc)
+    return sccs
+
+
+def scc_membership(graph: Dict[str, Set]) -> Dict[str, str]:
+    """
+    Map every node to the representative of its strongly connected component (the root found by Tarjan's algorithm)
+    """
+    return {member: scc[0] for scc in scc_tarjan(graph) for member in scc}
+
+
+def condensation(graph: Dict[str, Set]) -> Tuple[Graph, Dict[str, str]]:
+    """
+    Build the condensation of a directed graph: one node per SCC (labelled with the SCC representative) and an edge
+    between two SCCs if any edge of the graph connects their members. Returns the condensation DAG along with the
+    membership map from every node to its SCC representative
+    The condensation is acyclic and can be passed to any of the topological sorting functions
+    """
+    membership = scc_membership(graph)
+    dag: Dict[str, Set] = {rep: set() for rep in membership.values()}
+    for node, nbrs in graph.items():
+        rep = membership[node]
+        for nbr in nbrs:
+            nbr_rep = membership[nbr]
+            if nbr_rep != rep:
+                dag[rep].add(nbr_rep)
+    return Graph(graph=dag, is_directed=True), membership
+
+
+if __name__ == '__main__':
+    directed_cyclic_graph = SampleGraphs.directed_cyclic_disconn_graph().graph
+    print_graph(directed_cyclic_graph, message="\nDirected Cyclic Graph")
+
+    print("\n=> Strongly Connected Components using Tarjan's algorithm")
+    print(scc_tarjan(graph=directed_cyclic_graph))
+
+    print("\n=> Strongly Connected Components using Kosaraju's algorithm")
+    print(scc_kosaraju(graph=directed_cyclic_graph))
+
+    print("\n=> SCC membership")
+    print(scc_membership(graph=directed_cyclic_graph))
+
+    condensed_graph, _ = condensation(graph=directed_cyclic_graph)
+    print_graph(condensed_graph, message="\n=> Condensation DAG")
+
+    print("\n=> Topological Sort of the Condensation DAG")
+    print(top_sort_dfs_iterative(graph=condensed_graph.graph))
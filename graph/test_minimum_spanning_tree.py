@@ -0,0 +1,8 @@
+from graph.minimum_spanning_tree import WeightedEdgeList, boruvka_msf
+
+
+def test_boruvka_edgeless_graph():
+    edges = WeightedEdgeList()
+    edges.add_nodes(['A', 'B', 'C'])
+    assert boruvka_msf(edges) == []
+    assert boruvka_msf(edges, processes=2) == []
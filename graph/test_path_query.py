@@ -0,0 +1,10 @@
+from graph import SampleGraphs
+from graph.path_query import PathQueryEngine
+
+
+def test_unknown_nodes_return_none():
+    engine = PathQueryEngine(SampleGraphs.directed_cyclic_disconn_graph())
+    queries = [('Z', 'A'), ('A', 'Z'), ('Z', 'Z'), ('A', 'A')]
+    assert engine.shortest_paths(queries) == [None, None, None, ['A']]
+    assert engine.shortest_paths(queries, processes=2) == [None, None, None, ['A']]
+    assert engine.shortest_path('Z', 'A') is None
@@ -1,11 +1,17 @@
 import copy
 from collections import deque
-from typing import Dict, Set, List, Optional
+from typing import Any, Dict, Iterable, Iterator, Mapping, Set, List, Optional, Tuple, Union
 
 from graph import SampleGraphs, Markers, CycleFoundError, print_graph
+from graph.csr import CSRGraph
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, waves are always computed over the adjacency dict otherwise
+    np = None  # type: ignore
 
-def top_sort_dfs(graph: Dict[str, Set]) -> Optional[List]:
+
+def top_sort_dfs(graph: Mapping[str, Iterable[str]]) -> Optional[List]:
     """
     Using DFS and visit tracking markers/flags
     0 (Markers.NOT_VISITED) => node not visited
@@ -75,7 +81,46 @@ def _top_sort_dfs_no_exception(graph: Dict[str, Set]) -> Optional[List]:
     return list(reversed(top_stack))
 
 
-def top_sort_bfs(graph: Dict[str, Set]) -> Optional[List]:
+def top_sort_dfs_iterative(graph: Dict[str, Set]) -> Optional[List]:
+    """
+    Stack-safe version of `top_sort_dfs` using visit markers and an explicit stack of neighbor iterators
+    Every node is appended to the topological stack when its last neighbor is finished, which is exactly the DFS
+    finishing order of the recursive version, so both return identical orderings. Graphs with paths longer than the
+    recursion limit can be sorted without raising it
+    """
+    markers = dict.fromkeys(graph, Markers.NOT_VISITED)
+    top_stack = []
+    for root in graph.keys():
+        if markers[root] != Markers.NOT_VISITED:
+            continue
+        markers[root] = Markers.BEING_VISITED
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, nbrs = stack[-1]
+            for nbr in nbrs:
+                if markers[nbr] == Markers.BEING_VISITED:
+                    print("Graph is cyclic, topological sort not possible!")
+                    return None
+                if markers[nbr] == Markers.NOT_VISITED:
+                    markers[nbr] = Markers.BEING_VISITED
+                    stack.append((nbr, iter(graph[nbr])))
+                    break
+            else:
+                markers[node] = Markers.VISITED
+                top_stack.append(node)
+                stack.pop()
+    return list(reversed(top_stack))
+
+
+def _get_in_degrees(graph: Mapping[str, Iterable[str]]) -> Dict[str, int]:
+    in_degrees = {n: 0 for n in graph.keys()}
+    for node, nbrs in graph.items():
+        for nbr in nbrs:
+            in_degrees[nbr] += 1
+    return in_degrees
+
+
+def top_sort_bfs(graph: Mapping[str, Iterable[str]]) -> Optional[List]:
     """
     Using BFS and Indegree of nodes - Kahn's Algorithm
     Intuition:
@@ -85,13 +130,6 @@ def top_sort_bfs(graph: Dict[str, Set]) -> Optional[List]:
     - Repeat this process until all nodes are processed or a cycle is discovered
     Topological sorting can only be found for directed acyclic graphs
     """
-    def _get_in_degrees(graph):
-        in_degrees = {n: 0 for n in graph.keys()}
-        for node, nbrs in graph.items():
-            for nbr in nbrs:
-                in_degrees[nbr] += 1
-        return in_degrees
-
     in_degrees = _get_in_degrees(graph)
     queue = deque([n for n, ind in in_degrees.items() if ind == 0])  # initialize queue with nodes with 0 incoming edges
     top_ordering = []
@@ -102,16 +140,102 @@ def top_sort_bfs(graph: Dict[str, Set]) -> Optional[List]:
             in_degrees[nbr] -= 1  # reduce the indegree of all neighbors of this node by 1 as this node will be removed
             if in_degrees[nbr] == 0:
                 queue.append(nbr)  # if the nbr has 0 incoming edges after updating indegree, add nbr to queue
-        del graph[node]  # delete node as it's now added to topological sorting
 
     # if graph has a cycle, there will be a point in time when there are no new nbrs (nodes) without any incoming edges
-    # which will terminate the loop as the queue never gets refilled
-    if graph:
+    # which will terminate the loop as the queue never gets refilled, leaving nodes out of the topological sorting
+    # nodes are not deleted from the graph, so the caller's graph (or an immutable `CSRGraph`) is left untouched
+    if len(top_ordering) != len(in_degrees):
         print("Graph is cyclic, topological sort not possible!")
         return None
     return top_ordering
 
 
+def top_sort_bfs_waves(graph: Union[Dict[str, Set], CSRGraph], use_csr: bool = False) -> Iterator[List]:
+    """
+    Kahn's Algorithm processed level by level, yields each wave of nodes whose dependencies are all satisfied
+    - the first wave is all nodes with 0 incoming edges
+    - the next wave is all nodes whose indegree drops to 0 once all nodes of the current wave are removed
+    Nodes within a wave do not depend on each other, so a job runner can dispatch a whole wave concurrently, and the
+    number of waves is the length of the longest dependency chain (critical path)
+
+    For a `CSRGraph`, or with use_csr=True, the indegree updates of a wave are vectorized with NumPy over the integer
+    ids of the CSR graph (see `_top_sort_csr_waves`) when NumPy is available, which is an order of magnitude faster
+    than the per-edge updates over the adjacency dict; a dict graph is first converted to a `CSRGraph`, so pass a
+    `CSRGraph` to sort the same graph repeatedly.
+
+    Raises `CycleFoundError` once the remaining nodes cannot be processed because the graph has a cycle
+    """
+    if np is not None and (use_csr or isinstance(graph, CSRGraph)):
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph, is_directed=True)
+        yield from _top_sort_csr_waves(csr)
+        return
+
+    in_degrees = _get_in_degrees(graph)
+    wave = [n for n, ind in in_degrees.items() if ind == 0]
+    processed = 0
+    while wave:
+        yield wave
+        processed += len(wave)
+        next_wave = []
+        for node in wave:
+            for nbr in graph[node]:
+                in_degrees[nbr] -= 1
+                if in_degrees[nbr] == 0:
+                    next_wave.append(nbr)
+        wave = next_wave
+
+    # same as Kahn's algorithm, nodes on a cycle never get to 0 incoming edges
+    if processed != len(in_degrees):
+        raise CycleFoundError("Graph is cyclic, topological sort not possible!")
+
+
+def top_sort_bfs_levels(graph: Union[Dict[str, Set], CSRGraph], use_csr: bool = False) -> Optional[List[List]]:
+    """
+    Topological sorting grouped into waves (levels) using `top_sort_bfs_waves`
+    Flattening the waves gives a valid topological sorting
+    """
+    try:
+        return list(top_sort_bfs_waves(graph, use_csr=use_csr))
+    except CycleFoundError as ce:
+        print(ce)
+        return None
+
+
+def _top_sort_csr_waves(graph: CSRGraph) -> Iterator[List]:
+    """
+    `top_sort_bfs_waves` over the integer ids of a CSR graph, every wave being a NumPy array of node ids
+    The targets of all edges leaving a wave are gathered and counted at once (`_count_decrements`), and the counts are
+    subtracted from the indegrees of the distinct targets
+    """
+    labels = graph.labels
+    offsets = np.asarray(graph.offsets, dtype=np.int64)
+    targets = np.asarray(graph.targets, dtype=np.int64)
+    in_degrees = np.bincount(targets, minlength=graph.num_nodes)
+    wave = np.flatnonzero(in_degrees == 0)
+    processed = 0
+    while len(wave):
+        yield [labels[node_id] for node_id in wave.tolist()]
+        processed += len(wave)
+        nbrs, counts = _count_decrements(offsets, targets, wave)
+        in_degrees[nbrs] -= counts
+        wave = nbrs[in_degrees[nbrs] == 0]  # distinct and sorted, as returned by np.unique
+
+    if processed != graph.num_nodes:
+        raise CycleFoundError("Graph is cyclic, topological sort not possible!")
+
+
+def _count_decrements(offsets, targets, wave) -> Tuple[Any, Any]:
+    """
+    Distinct targets of the edges leaving the nodes of a wave, along with the number of such edges to each of them
+    """
+    starts = offsets[wave]
+    lengths = offsets[wave + 1] - starts
+    # position of every edge in targets: the edges of the i-th node of the wave are numbered from the sum of the
+    # previous lengths, and start at starts[i]
+    positions = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(lengths.sum())
+    return np.unique(targets[positions], return_counts=True)
+
+
 if __name__ == '__main__':
     directed_cyclic_graph = SampleGraphs.directed_cyclic_conn_graph().graph
     directed_acyclic_graph = SampleGraphs.directed_acyclic_conn_graph().graph
@@ -131,3 +255,14 @@ if __name__ == '__main__':
     print("\n-> Directed Acyclic Graph")
     print(top_sort_bfs(graph=copy.deepcopy(directed_acyclic_graph)))
 
+    print("\n=> Topological Sort using iterative DFS Color Marker Method")
+    print("\n-> Directed Cyclic Graph")
+    print(top_sort_dfs_iterative(graph=directed_cyclic_graph))
+    print("\n-> Directed Acyclic Graph")
+    print(top_sort_dfs_iterative(graph=directed_acyclic_graph))
+
+    print("\n=> Topological Sort grouped into waves using Kahn's Algorithm")
+    print("\n-> Directed Cyclic Graph")
+    print(top_sort_bfs_levels(graph=directed_cyclic_graph))
+    print("\n-> Directed Acyclic Graph")
+    print(top_sort_bfs_levels(graph=directed_acyclic_graph))
@@ -1,6 +1,7 @@
 import random
 from collections import deque
-from typing import Dict, Set
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Set, Tuple, Union
 
 from graph import SampleGraphs, print_graph
 
@@ -16,7 +17,7 @@ def dfs_recursive(graph: Dict[str, Set], node: str, visited: Set) -> Set:
     return visited
 
 
-def dfs_iterative(graph: Dict[str, Set], start_node: str) -> Set:
+def dfs_iterative(graph: Mapping[str, Iterable[str]], start_node: str) -> Set:
     """
     Iterative DFS - works for all types of graphs {directed, undirected, cyclic, acyclic, connected, disconnected}
     """
@@ -25,7 +26,7 @@ def dfs_iterative(graph: Dict[str, Set], start_node: str) -> Set:
     while stack:
         node = stack.pop()
         visited.add(node)
-        stack.extend(graph[node] - visited)
+        stack.extend(nbr for nbr in graph[node] if nbr not in visited)
     return visited
 
 
@@ -42,7 +43,7 @@ def bfs_iterative(graph: Dict[str, Set], start_node: str) -> Set:
     return visited
 
 
-def bfs_iterative_optimized(graph: Dict[str, Set], start_node: str) -> Set:
+def bfs_iterative_optimized(graph: Mapping[str, Iterable[str]], start_node: str) -> Set:
     """
     Iterative BFS optimized - works for all types of graphs {directed, undirected, cyclic, acyclic, connected, disconnected}
     1. Reduced memory consumption
@@ -81,12 +82,104 @@ def bfs_iterative_optimized(graph: Dict[str, Set], start_node: str) -> Set:
     queue = deque([start_node])
     while queue:
         node = queue.popleft()
-        for nbr in graph[node] - visited:
-            visited.add(nbr)
-            queue.append(nbr)
+        for nbr in graph[node]:
+            if nbr not in visited:
+                visited.add(nbr)
+                queue.append(nbr)
     return visited
 
 
+def dfs_explicit_stack(graph: Dict[str, Set], node: str, visited: Set) -> Set:
+    """
+    Stack-safe version of `dfs_recursive` - works for all types of graphs {directed, undirected, cyclic, acyclic, connected, disconnected}
+    Nodes are visited in exactly the same order as `dfs_recursive`, but instead of one Python frame per node, an explicit
+    stack holds an iterator over the neighbors of every node on the current DFS path. Deep graphs (eg: long chains) do
+    not hit the recursion limit and there is no function call overhead per edge
+    """
+    visited.add(node)
+    stack = [iter(graph[node] - visited)]
+    while stack:
+        for nbr in stack[-1]:
+            if nbr not in visited:
+                visited.add(nbr)
+                stack.append(iter(graph[nbr] - visited))
+                break  # descend into nbr, the iterator of the current node resumes once nbr is done
+        else:
+            stack.pop()  # all neighbors visited
+    return visited
+
+
+TraversalItem = Union[str, Tuple[str, int, Optional[str]]]
+
+
+def dfs_lazy(graph: Mapping[str, Iterable[str]], start_node: str, max_depth: Optional[int] = None,
+             predicate: Optional[Callable[[str], bool]] = None, with_info: bool = False) -> Iterator[TraversalItem]:
+    """
+    Lazy DFS - works for all types of graphs {directed, undirected, cyclic, acyclic, connected, disconnected}
+    Generator yielding nodes as they are discovered, in DFS preorder, exploring neighbors in the iteration order of
+    `graph[node]`
+    - with_info: yield (node, depth, parent) tuples instead of nodes, parent of the start node is None
+    - max_depth: do not descend below nodes at this depth (the start node is at depth 0)
+    - predicate: only yield nodes for which it returns True, the traversal still goes through all nodes
+
+    Nothing is computed before the first node is requested, and stopping the iteration (eg: `break`, `next`,
+    `itertools.islice`) stops the traversal, so looking for the first few matches does not traverse the whole graph.
+    Extra memory is only the visited set and the stack of the current DFS path.
+
+    NOTE: with max_depth, a node first discovered at a depth deeper than its shortest distance is not revisited by a
+    shorter path, so nodes within max_depth hops may be skipped; use `bfs_lazy` when the depth limit must be exact
+    """
+    visited = {start_node}
+    if predicate is None or predicate(start_node):
+        yield (start_node, 0, None) if with_info else start_node
+    if max_depth is not None and max_depth <= 0:
+        return
+    stack = [(start_node, iter(graph[start_node]))]
+    while stack:
+        parent, nbrs = stack[-1]
+        for nbr in nbrs:
+            if nbr not in visited:
+                visited.add(nbr)
+                depth = len(stack)
+                if predicate is None or predicate(nbr):
+                    yield (nbr, depth, parent) if with_info else nbr
+                if max_depth is None or depth < max_depth:
+                    stack.append((nbr, iter(graph[nbr])))
+                    break  # descend into nbr, the iterator of the current node resumes once nbr is done
+        else:
+            stack.pop()  # all neighbors visited
+
+
+def bfs_lazy(graph: Mapping[str, Iterable[str]], start_node: str, max_depth: Optional[int] = None,
+             predicate: Optional[Callable[[str], bool]] = None, with_info: bool = False) -> Iterator[TraversalItem]:
+    """
+    Lazy BFS - works for all types of graphs {directed, undirected, cyclic, acyclic, connected, disconnected}
+    Generator yielding nodes as they are discovered, in level order (same visiting scheme as `bfs_iterative_optimized`)
+    - with_info: yield (node, depth, parent) tuples instead of nodes, where depth is the number of hops from the start
+      node and parent is the node it was discovered from (None for the start node)
+    - max_depth: do not yield nodes more than this many hops away from the start node
+    - predicate: only yield nodes for which it returns True, the traversal still goes through all nodes
+
+    Nothing is computed before the first node is requested, and stopping the iteration stops the traversal; eg: the
+    nearest node matching a predicate is `next(bfs_lazy(graph, start, predicate=...), None)`
+    Extra memory is only the visited set and the queue of discovered nodes.
+    """
+    visited = {start_node}
+    if predicate is None or predicate(start_node):
+        yield (start_node, 0, None) if with_info else start_node
+    queue = deque([(start_node, 0)])
+    while queue:
+        node, depth = queue.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue  # queue is in level order, nodes at max_depth are not expanded
+        for nbr in graph[node]:
+            if nbr not in visited:
+                visited.add(nbr)
+                if predicate is None or predicate(nbr):
+                    yield (nbr, depth + 1, node) if with_info else nbr
+                queue.append((nbr, depth + 1))
+
+
 if __name__ == '__main__':
     graph = SampleGraphs.undirected_cyclic_conn_graph().graph
     nodes = list(graph.keys())
@@ -107,3 +200,15 @@ if __name__ == '__main__':
 
     print("\n=> Breadth-first Search Iterative Level order Optimized")
     print(bfs_iterative_optimized(graph=graph, start_node=start_node))
+
+    print("\n=> Depth-first Search using an explicit stack (stack-safe version of recursive DFS)")
+    print(dfs_explicit_stack(graph=graph, node=start_node, visited=set()))
+
+    print("\n=> Lazy Depth-first Search, first 3 nodes only")
+    print(list(islice(dfs_lazy(graph=graph, start_node=start_node), 3)))
+
+    print("\n=> Lazy Breadth-first Search with (node, depth, parent) up to depth 1")
+    print(list(bfs_lazy(graph=graph, start_node=start_node, max_depth=1, with_info=True)))
+
+    print("\n=> Lazy Breadth-first Search, nearest node among {'E', 'F'}")
+    print(next(bfs_lazy(graph=graph, start_node=start_node, predicate=lambda node: node in {'E', 'F'}), None))
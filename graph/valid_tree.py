@@ -81,6 +81,82 @@ def graph_valid_tree_directed_using_dfs(graph: Dict[str, Set]) -> bool:
     return conn_comps == 1
 
 
+def _dfs_reachable_iterative(graph: Dict[str, Set], node: str) -> Set:
+    visited = {node}
+    stack = [node]
+    while stack:
+        curr = stack.pop()
+        for nbr in graph[curr]:
+            if nbr not in visited:
+                visited.add(nbr)
+                stack.append(nbr)
+    return visited
+
+
+def graph_valid_tree_undirected_using_num_edges_iterative(graph: Dict[str, Set]) -> bool:
+    """
+    Stack-safe version of `graph_valid_tree_undirected_using_num_edges`, the single pass DFS uses an explicit stack
+    """
+    nodes = list(graph.keys())
+    num_nodes = len(nodes)
+    num_edges = sum(len(nbrs) for nbrs in graph.values()) // 2
+
+    if num_edges != num_nodes - 1:
+        return False  # if num_edges > num_nodes - 1 => cycle exist; num_edges < num_nodes - 1 => graph disconnected
+
+    return len(_dfs_reachable_iterative(graph, random.choice(nodes))) == num_nodes
+
+
+def graph_valid_tree_undirected_using_dfs_iterative(graph: Dict[str, Set]) -> bool:
+    """
+    Stack-safe version of `graph_valid_tree_undirected_using_dfs` using an explicit stack of (node, prev, neighbor
+    iterator) entries instead of recursion
+    """
+    nodes = list(graph.keys())
+    root = random.choice(nodes)
+    visited = {root}
+    stack = [(root, "#", iter(graph[root]))]
+    while stack:
+        node, prev, nbrs = stack[-1]
+        for nbr in nbrs:
+            if nbr != prev:  # ignore bidirected edges in an undirected graph causing trivial cycles
+                if nbr in visited:
+                    return False  # cycle found
+                visited.add(nbr)
+                stack.append((nbr, node, iter(graph[nbr])))
+                break
+        else:
+            stack.pop()
+    return len(visited) == len(nodes)
+
+
+def graph_valid_tree_directed_using_dfs_iterative(graph: Dict[str, Set]) -> bool:
+    """
+    Stack-safe version of `graph_valid_tree_directed_using_dfs` using visit markers and an explicit stack
+    Unlike the recursive version, nodes already fully visited (marker 2) are not explored again
+    """
+    conn_comps, markers = 0, dict.fromkeys(graph, 0)
+    for root in graph:
+        if markers[root] != 0:
+            continue
+        conn_comps += 1
+        markers[root] = 1
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, nbrs = stack[-1]
+            for nbr in nbrs:
+                if markers[nbr] == 1:
+                    return False  # cycle found
+                if markers[nbr] == 0:
+                    markers[nbr] = 1
+                    stack.append((nbr, iter(graph[nbr])))
+                    break
+            else:
+                markers[node] = 2
+                stack.pop()
+    return conn_comps == 1
+
+
 if __name__ == '__main__':
     valid_undirected_graph = SampleGraphs.undirected_acyclic_conn_graph().graph
     invalid_undirected_graph = SampleGraphs.undirected_cyclic_conn_graph().graph
@@ -109,3 +185,21 @@ if __name__ == '__main__':
     print(graph_valid_tree_directed_using_dfs(graph=valid_directed_graph))
     print("\n-> Directed Disconnected Acyclic Graph - Invalid")
     print(graph_valid_tree_directed_using_dfs(graph=invalid_directed_graph))
+
+    print("\n=> Check if an Undirected Graph is a valid tree using number of edges and iterative DFS")
+    print("\n-> Undirected Connected Acyclic Graph - Valid")
+    print(graph_valid_tree_undirected_using_num_edges_iterative(graph=valid_undirected_graph))
+    print("\n-> Undirected Connected Cyclic Graph - Invalid")
+    print(graph_valid_tree_undirected_using_num_edges_iterative(graph=invalid_undirected_graph))
+
+    print("\n=> Check if an Undirected Graph is a valid tree using only iterative DFS")
+    print("\n-> Undirected Connected Acyclic Graph - Valid")
+    print(graph_valid_tree_undirected_using_dfs_iterative(graph=valid_undirected_graph))
+    print("\n-> Undirected Connected Cyclic Graph - Invalid")
+    print(graph_valid_tree_undirected_using_dfs_iterative(graph=invalid_undirected_graph))
+
+    print("\n=> Check if a Directed Graph is a valid tree using iterative DFS and connected components")
+    print("\n-> Directed Connected Acyclic Graph - Valid")
+    print(graph_valid_tree_directed_using_dfs_iterative(graph=valid_directed_graph))
+    print("\n-> Directed Disconnected Acyclic Graph - Invalid")
+    print(graph_valid_tree_directed_using_dfs_iterative(graph=invalid_directed_graph))
@@ -1,4 +1,5 @@
-from typing import Dict, Iterable
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from enum import Enum
 
 
@@ -7,6 +8,83 @@ class UnionMethod(Enum):
     BY_SIZE = 1
 
 
+class CompressionMethod(Enum):
+    """
+    Path compression strategies used by `find_set`, all of them are iterative and give the same O(⍺(n)) amortized bound
+    - FULL: two passes, find the root and then point every node on the path directly to the root
+    - HALVING: single pass, point every other node on the path to its grandparent
+    - SPLITTING: single pass, point every node on the path to its grandparent
+    """
+    FULL = 0
+    HALVING = 1
+    SPLITTING = 2
+
+
+class _SetStatsIndex:
+    """
+    Index of disjoint set statistics maintained alongside the parent pointers, independent of the union method
+    - sizes: size of every set, keyed by its representative
+    - members: a circular linked list of the members of every set through "next" pointers; merging two sets swaps the
+      next pointers of their representatives which splices both circular lists into one in O(1), and walking the list
+      from any member enumerates the whole set in O(size)
+    - sizes histogram: representatives of all sets grouped by set size, plus a sorted list of the distinct set sizes, so
+      the k largest sets are found in O(k) by walking the distinct sizes from the largest one
+    There are at most O(sqrt(n)) distinct sizes for n elements, which bounds the cost of keeping them sorted
+    """
+    def __init__(self):
+        self.sizes: Dict[str, int] = {}
+        self.next: Dict[str, str] = {}
+        self.sets_by_size: Dict[int, Set[str]] = {}
+        self.distinct_sizes: List[int] = []
+
+    def add_element(self, element: str) -> None:
+        self.sizes[element] = 1
+        self.next[element] = element
+        self._add_set(element, 1)
+
+    def merge(self, rep: str, attached_rep: str) -> None:
+        """
+        Record that the set of `attached_rep` was attached under `rep`
+        """
+        size, attached_size = self.sizes[rep], self.sizes.pop(attached_rep)
+        self._remove_set(rep, size)
+        self._remove_set(attached_rep, attached_size)
+        self.sizes[rep] = size + attached_size
+        self._add_set(rep, size + attached_size)
+        self.next[rep], self.next[attached_rep] = self.next[attached_rep], self.next[rep]
+
+    def members(self, rep: str) -> List[str]:
+        members = [rep]
+        member = self.next[rep]
+        while member != rep:
+            members.append(member)
+            member = self.next[member]
+        return members
+
+    def largest_sets(self, k: int) -> List[Tuple[str, int]]:
+        largest: List[Tuple[str, int]] = []
+        for size in reversed(self.distinct_sizes):
+            for rep in self.sets_by_size[size]:
+                if len(largest) == k:
+                    return largest
+                largest.append((rep, size))
+        return largest
+
+    def _add_set(self, rep: str, size: int) -> None:
+        reps = self.sets_by_size.get(size)
+        if reps is None:
+            reps = self.sets_by_size[size] = set()
+            insort(self.distinct_sizes, size)
+        reps.add(rep)
+
+    def _remove_set(self, rep: str, size: int) -> None:
+        reps = self.sets_by_size[size]
+        reps.remove(rep)
+        if not reps:
+            del self.sets_by_size[size]
+            del self.distinct_sizes[bisect_left(self.distinct_sizes, size)]
+
+
 class DisjointSetUnion:
     """
     Reference: https://cp-algorithms.com/data_structures/disjoint_set_union.html
@@ -20,17 +98,25 @@ class DisjointSetUnion:
 
     This is a full implementation of DisjointSetUnion capable of performing both, union-by-rank or union-by-size.
     You'll need to pass the union method at the time of creating an instance of DisjointSetUnion (defaults to union-by-rank)
+    The path compression method can be chosen the same way (defaults to full path compression), see `CompressionMethod`
+
+    Pass `track_stats=True` to maintain an index of set sizes and members regardless of the union method, which makes
+    enumerating the members of a set O(size) and finding the k largest sets O(k), at the cost of extra bookkeeping on
+    every union (see `_SetStatsIndex`)
 
     NOTE: For graph applications, DisjointSetUnion data structure _only_ works with undirected graphs
     """
-    def __init__(self, union_method: UnionMethod = UnionMethod.BY_RANK):
+    def __init__(self, union_method: UnionMethod = UnionMethod.BY_RANK,
+                 compression_method: CompressionMethod = CompressionMethod.FULL, track_stats: bool = False):
         self._disjoint_set_count = 0
         self._largest_disjoint_set_size = 0  # only computed if performing union-by-size
         self._union_method = union_method
+        self._compression_method = compression_method
         self._representatives: Dict[str, str] = {}
         # use one from rank/size for your implementation; both are added here as this is an illustrative data structure
         self._ranks: Dict[str, int] = {}
         self._sizes: Dict[str, int] = {}
+        self._stats: Optional[_SetStatsIndex] = _SetStatsIndex() if track_stats else None
 
     def make_set(self, elements: Iterable[str]) -> None:
         element_added = False
@@ -43,14 +129,39 @@ class DisjointSetUnion:
                     self._sizes[e] = 1
                 else:
                     self._ranks[e] = 0
+                if self._stats is not None:
+                    self._stats.add_element(e)
         if element_added:
             self._largest_disjoint_set_size = max(self._largest_disjoint_set_size, 1)
 
     def find_set(self, element: str) -> str:
-        if self._representatives[element] != element:
-            # compress path while finding the top-level representative
-            self._representatives[element] = self.find_set(self._representatives[element])
-        return self._representatives[element]
+        """
+        Find the top-level representative of the element while compressing the path to it
+        Iterative, so arbitrarily deep trees do not hit the recursion limit and there is no function call per level
+        """
+        parents = self._representatives
+        if self._compression_method == CompressionMethod.HALVING:
+            parent = parents[element]
+            while parent != element:
+                parents[element] = parents[parent]  # point to grandparent and skip to it
+                element = parents[element]
+                parent = parents[element]
+            return element
+
+        if self._compression_method == CompressionMethod.SPLITTING:
+            parent = parents[element]
+            while parent != element:
+                parents[element] = parents[parent]  # point to grandparent and move on to the (old) parent
+                element, parent = parent, parents[parent]
+            return element
+
+        root = element
+        while parents[root] != root:
+            root = parents[root]
+        # second pass: compress path, point every node on the path directly to the root
+        while parents[element] != root:
+            parents[element], element = root, parents[element]
+        return root
     
     def union_set(self, element1: str, element2: str) -> bool:
         rep1 = self.find_set(element1)
@@ -71,11 +182,40 @@ class DisjointSetUnion:
         # union performed
         return True
 
+    def union_many(self, elements1: Iterable[str], elements2: Iterable[str]) -> int:
+        """
+        Perform union_set on every pair (elements1[i], elements2[i]) in one call
+        Returns the number of unions performed
+        """
+        find_set, union_method = self.find_set, self._union_method
+        unions = 0
+        for element1, element2 in zip(elements1, elements2):
+            rep1 = find_set(element1)
+            rep2 = find_set(element2)
+            if rep1 != rep2:
+                if union_method == UnionMethod.BY_RANK:
+                    self._union_by_rank(rep1, rep2)
+                else:
+                    self._union_by_size(rep1, rep2)
+                unions += 1
+        self._disjoint_set_count -= unions
+        return unions
+
+    def find_many(self, elements: Iterable[str]) -> List[str]:
+        """
+        Find the representatives of a batch of elements in one call, in the order of the elements
+        Cheaper than `get_representatives()` when only some of the elements are needed
+        """
+        find_set = self.find_set
+        return [find_set(e) for e in elements]
+
     def _union_by_rank(self, rep1: str, rep2: str) -> None:
         if self._ranks[rep1] < self._ranks[rep2]:
             rep1, rep2 = rep2, rep1
         self._representatives[rep2] = rep1
         self._ranks[rep1] += 1
+        if self._stats is not None:
+            self._stats.merge(rep1, rep2)
 
     def _union_by_size(self, rep1: str, rep2: str) -> None:
         if self._sizes[rep1] < self._sizes[rep2]:
@@ -83,6 +223,8 @@ class DisjointSetUnion:
         self._representatives[rep2] = rep1
         self._sizes[rep1] += self._sizes[rep2]
         self._largest_disjoint_set_size = max(self._largest_disjoint_set_size, self._sizes[rep1])
+        if self._stats is not None:
+            self._stats.merge(rep1, rep2)
 
     def get_union_method(self) -> UnionMethod:
         """
@@ -90,6 +232,12 @@ class DisjointSetUnion:
         """
         return self._union_method
 
+    def get_compression_method(self) -> CompressionMethod:
+        """
+        Returns the path compression method being used by the data structure
+        """
+        return self._compression_method
+
     def get_representatives(self) -> Dict[str, str]:
         """
         Get representatives of all elements in the data structure at the moment
@@ -102,12 +250,61 @@ class DisjointSetUnion:
         """
         return self._disjoint_set_count
 
+    def get_disjoint_set_size(self, element: str) -> int:
+        """
+        Get size of the disjoint set containing the element
+        Only works if performing union-by-size (union_method=UnionMethod.BY_SIZE) or tracking stats (track_stats=True)
+        """
+        if self._stats is not None:
+            return self._stats.sizes[self.find_set(element)]
+        if self._union_method != UnionMethod.BY_SIZE:
+            raise ValueError("Disjoint set sizes are only tracked when performing union-by-size or tracking stats")
+        return self._sizes[self.find_set(element)]
+
+    def get_disjoint_set_members(self, element: str) -> List[str]:
+        """
+        Get all members of the disjoint set containing the element in O(size of the set)
+        Only works if tracking stats (track_stats=True)
+        """
+        return self._get_stats().members(self.find_set(element))
+
+    def get_disjoint_set_size_histogram(self) -> Dict[int, int]:
+        """
+        Get number of disjoint sets of every size, eg: {1: 3, 4: 2} => 3 sets of size 1 and 2 sets of size 4
+        Only works if tracking stats (track_stats=True)
+        """
+        stats = self._get_stats()
+        return {size: len(stats.sets_by_size[size]) for size in stats.distinct_sizes}
+
+    def get_largest_disjoint_sets(self, k: int) -> List[Tuple[str, int]]:
+        """
+        Get (representative, size) of the k largest disjoint sets, largest first, in O(k)
+        Only works if tracking stats (track_stats=True)
+        """
+        return self._get_stats().largest_sets(k)
+
+    def _get_stats(self) -> _SetStatsIndex:
+        if self._stats is None:
+            raise ValueError("Disjoint set statistics are only tracked when created with track_stats=True")
+        return self._stats
+
+    def get_disjoint_sets(self) -> Dict[str, List[str]]:
+        """
+        Get members of all disjoint sets in the data structure at the moment, grouped by their representative
+        """
+        disjoint_sets: Dict[str, List[str]] = {}
+        for e in self._representatives.keys():
+            disjoint_sets.setdefault(self.find_set(e), []).append(e)
+        return disjoint_sets
+
     def get_largest_disjoint_set_size(self) -> int:
         """
         Get size of the largest disjoint set that exists in the data structure thus far...
-        Only works if performing union-by-size (union_method=UnionMethod.BY_SIZE)
+        Only works if performing union-by-size (union_method=UnionMethod.BY_SIZE) or tracking stats (track_stats=True)
         Very useful in solving problems like finding the size of the longest consecutive sequence in an array
         """
+        if self._stats is not None:
+            return self._stats.distinct_sizes[-1] if self._stats.distinct_sizes else 0
         return self._largest_disjoint_set_size
 
     def __str__(self):
@@ -163,3 +360,16 @@ if __name__ == '__main__':
     print("\nPerforming union_set {'F', 'A'}")
     dsu.union_set('F', 'A')
     print(dsu)
+
+    print("\nPerforming union_many {('G', 'H'), ('A', 'B')} and find_many {'A', 'E', 'H'}")
+    dsu.union_many(['G', 'A'], ['H', 'B'])
+    print(dsu.find_many(['A', 'E', 'H']))
+
+    stats_dsu = DisjointSetUnion(union_method=UnionMethod.BY_RANK, track_stats=True)
+    print("\nPerforming make_set {'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'} with set statistics tracked")
+    stats_dsu.make_set(['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'])
+    print("\nPerforming union_set {'A', 'B'}, {'B', 'C'}, {'D', 'E'}")
+    stats_dsu.union_many(['A', 'B', 'D'], ['B', 'C', 'E'])
+    print("-> Members of the set of 'C': {}".format(stats_dsu.get_disjoint_set_members('C')))
+    print("-> Size histogram: {}".format(stats_dsu.get_disjoint_set_size_histogram()))
+    print("-> Two largest sets: {}".format(stats_dsu.get_largest_disjoint_sets(2)))
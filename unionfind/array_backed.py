@@ -0,0 +1,361 @@
+from array import array
+from typing import Dict, Iterable, List, Sequence
+
+from unionfind import CompressionMethod, UnionMethod
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch operations fall back to plain Python loops
+    np = None  # type: ignore
+
+_NOT_CREATED = -1
+
+
+class ArrayDisjointSetUnion:
+    """
+    Disjoint Set Union specialized for dense integer elements, backed by flat `array` buffers
+
+    `DisjointSetUnion` keeps parents, ranks and sizes in dicts keyed by element, which costs a hash table slot plus a
+    boxed Python object per element and per dict (~100+ bytes per element). Here element `i` is simply index `i` of:
+    - parents: array('i') - 4 bytes per element; -1 marks an index that is not (yet) an element of any set
+    - ranks: array('B') - 1 byte per element, only allocated for union-by-rank (ranks never exceed log2(n))
+    - sizes: array('i') - 4 bytes per element, only allocated for union-by-size
+    i.e. 5-8 bytes per element, an order of magnitude less than the dict based version, and lookups are plain indexing.
+
+    Same API as `DisjointSetUnion` with integer elements in [0, 2^31). Elements need not be contiguous, but the buffers
+    are sized by the largest element, so use `LabeledDisjointSetUnion` for arbitrary (eg: string) elements.
+    """
+    def __init__(self, union_method: UnionMethod = UnionMethod.BY_RANK,
+                 compression_method: CompressionMethod = CompressionMethod.FULL):
+        self._disjoint_set_count = 0
+        self._largest_disjoint_set_size = 0
+        self._union_method = union_method
+        self._compression_method = compression_method
+        self._parents = array('i')
+        self._ranks = array('B')
+        self._sizes = array('i')
+
+    def make_set(self, elements: Iterable[int]) -> None:
+        parents = self._parents
+        by_size = self._union_method == UnionMethod.BY_SIZE
+        for e in elements:
+            if e < 0:
+                raise ValueError("Elements must be non-negative integers, got {}".format(e))
+            if e >= len(parents):
+                self._grow(e + 1)
+            if parents[e] == _NOT_CREATED:
+                parents[e] = e
+                self._disjoint_set_count += 1
+                if by_size:
+                    self._sizes[e] = 1
+                self._largest_disjoint_set_size = max(self._largest_disjoint_set_size, 1)
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self._parents)
+        self._parents.extend(array('i', [_NOT_CREATED]) * extra)
+        if self._union_method == UnionMethod.BY_SIZE:
+            self._sizes.extend(array('i', [0]) * extra)
+        else:
+            self._ranks.extend(array('B', [0]) * extra)
+
+    def find_set(self, element: int) -> int:
+        parents = self._parents
+        if element < 0:
+            raise ValueError("Elements must be non-negative integers, got {}".format(element))
+        if element >= len(parents) or parents[element] == _NOT_CREATED:
+            raise KeyError(element)
+
+        if self._compression_method == CompressionMethod.HALVING:
+            parent = parents[element]
+            while parent != element:
+                parents[element] = parents[parent]  # point to grandparent and skip to it
+                element = parents[element]
+                parent = parents[element]
+            return element
+
+        if self._compression_method == CompressionMethod.SPLITTING:
+            parent = parents[element]
+            while parent != element:
+                parents[element] = parents[parent]  # point to grandparent and move on to the (old) parent
+                element, parent = parent, parents[parent]
+            return element
+
+        root = element
+        while parents[root] != root:
+            root = parents[root]
+        # second pass: compress path, point every node on the path directly to the root
+        while parents[element] != root:
+            parents[element], element = root, parents[element]
+        return root
+
+    def union_set(self, element1: int, element2: int) -> bool:
+        rep1 = self.find_set(element1)
+        rep2 = self.find_set(element2)
+
+        # elements are in the same set and have a common group representative
+        if rep1 == rep2:
+            return False  # union not performed
+
+        if self._union_method == UnionMethod.BY_RANK:
+            self._union_by_rank(rep1, rep2)
+        else:
+            self._union_by_size(rep1, rep2)
+
+        # total disjoint set count reduced by one after the union
+        self._disjoint_set_count -= 1
+
+        # union performed
+        return True
+
+    def union_many(self, elements1: Sequence[int], elements2: Sequence[int]) -> int:
+        """
+        Perform union_set on every pair (elements1[i], elements2[i]) in one call, accepts lists, arrays or NumPy arrays
+        Returns the number of unions performed
+
+        With NumPy, the representatives of both sides are first found for the whole batch with `find_many` and pairs
+        that are already in the same set are dropped before any union is performed (pairs in the same set stay in the
+        same set). Only the remaining pairs go through the sequential union loop, which helps batches with many
+        redundant pairs, eg: edges of dense graphs
+        """
+        if np is not None and len(elements1) > 0:
+            reps1, reps2 = self.find_many(elements1), self.find_many(elements2)
+            pending = np.flatnonzero(reps1 != reps2)
+            elements1, elements2 = reps1[pending].tolist(), reps2[pending].tolist()
+
+        find_set, union_method = self.find_set, self._union_method
+        unions = 0
+        for element1, element2 in zip(elements1, elements2):
+            rep1 = find_set(element1)
+            rep2 = find_set(element2)
+            if rep1 != rep2:
+                if union_method == UnionMethod.BY_RANK:
+                    self._union_by_rank(rep1, rep2)
+                else:
+                    self._union_by_size(rep1, rep2)
+                unions += 1
+        self._disjoint_set_count -= unions
+        return unions
+
+    def find_many(self, elements: Sequence[int]):
+        """
+        Find the representatives of a batch of elements in one call, in the order of the elements
+        Returns a NumPy array if NumPy is available, otherwise an array('i')
+
+        With NumPy, all queries walk up their trees together by vectorized pointer jumping over a zero-copy view of the
+        parents buffer: `roots = parents[roots]` until no root changes, i.e. one vectorized step per tree level instead
+        of one Python loop iteration per element per level. The queried elements are then pointed directly to their
+        representatives (path compression for the queried elements only)
+        """
+        if np is None:
+            find_set = self.find_set
+            return array('i', [find_set(e) for e in elements])
+
+        parents = np.frombuffer(self._parents, dtype=np.intc)
+        try:
+            queries = np.asarray(elements, dtype=np.intc)
+            if (queries < 0).any():
+                raise ValueError("Elements must be non-negative integers, got {}".format(queries[queries < 0][0]))
+            roots = parents[queries]
+            if (roots == _NOT_CREATED).any():
+                raise KeyError(queries[roots == _NOT_CREATED][0])
+            while True:
+                next_roots = parents[roots]
+                if np.array_equal(next_roots, roots):
+                    break
+                roots = next_roots
+            parents[queries] = roots
+            return roots
+        finally:
+            del parents  # release the view, the parents buffer cannot be resized while it is exported
+
+    def _union_by_rank(self, rep1: int, rep2: int) -> None:
+        ranks = self._ranks
+        if ranks[rep1] < ranks[rep2]:
+            rep1, rep2 = rep2, rep1
+        self._parents[rep2] = rep1
+        if ranks[rep1] == ranks[rep2]:
+            ranks[rep1] += 1  # rank only grows when merging trees of equal rank, so it stays within a byte
+
+    def _union_by_size(self, rep1: int, rep2: int) -> None:
+        sizes = self._sizes
+        if sizes[rep1] < sizes[rep2]:
+            rep1, rep2 = rep2, rep1
+        self._parents[rep2] = rep1
+        sizes[rep1] += sizes[rep2]
+        self._largest_disjoint_set_size = max(self._largest_disjoint_set_size, sizes[rep1])
+
+    def get_union_method(self) -> UnionMethod:
+        """
+        Returns the union method being used by the data structure
+        """
+        return self._union_method
+
+    def get_compression_method(self) -> CompressionMethod:
+        """
+        Returns the path compression method being used by the data structure
+        """
+        return self._compression_method
+
+    def get_elements(self) -> List[int]:
+        """
+        Get all elements in the data structure at the moment
+        """
+        return [e for e, parent in enumerate(self._parents) if parent != _NOT_CREATED]
+
+    def get_representatives(self) -> Dict[int, int]:
+        """
+        Get representatives of all elements in the data structure at the moment
+        """
+        return {e: self.find_set(e) for e in self.get_elements()}
+
+    def get_disjoint_set_count(self) -> int:
+        """
+        Get total number of disjoint sets in the data structure at the moment
+        """
+        return self._disjoint_set_count
+
+    def get_disjoint_set_size(self, element: int) -> int:
+        """
+        Get size of the disjoint set containing the element
+        Only works if performing union-by-size (union_method=UnionMethod.BY_SIZE)
+        """
+        if self._union_method != UnionMethod.BY_SIZE:
+            raise ValueError("Disjoint set sizes are only tracked when performing union-by-size")
+        return self._sizes[self.find_set(element)]
+
+    def get_largest_disjoint_set_size(self) -> int:
+        """
+        Get size of the largest disjoint set that exists in the data structure thus far...
+        Only works if performing union-by-size (union_method=UnionMethod.BY_SIZE)
+        """
+        return self._largest_disjoint_set_size
+
+    def memory_usage(self) -> int:
+        """
+        Number of bytes used by the element buffers
+        """
+        return sum(buffer.itemsize * len(buffer) for buffer in (self._parents, self._ranks, self._sizes))
+
+    def __str__(self):
+        return "ArrayDisjointSetUnion@{}: {}\n-> Representatives: {}\n-> Total disjoint set count: {}".format(
+            id(self),
+            self.get_union_method(),
+            list(self.get_representatives().values()),
+            self.get_disjoint_set_count()
+        )
+
+
+class LabeledDisjointSetUnion:
+    """
+    `ArrayDisjointSetUnion` for arbitrary hashable elements (eg: strings)
+    Every element is interned to a dense integer id the first time it is added, so only a single label -> id dict and a
+    list of labels are kept per element in addition to the integer buffers
+    """
+    def __init__(self, union_method: UnionMethod = UnionMethod.BY_RANK,
+                 compression_method: CompressionMethod = CompressionMethod.FULL):
+        self._ids: Dict[str, int] = {}
+        self._labels: List[str] = []
+        self._dsu = ArrayDisjointSetUnion(union_method=union_method, compression_method=compression_method)
+
+    def make_set(self, elements: Iterable[str]) -> None:
+        ids, labels = self._ids, self._labels
+        new_ids = []
+        for e in elements:
+            if e not in ids:
+                ids[e] = len(labels)
+                labels.append(e)
+                new_ids.append(ids[e])
+        self._dsu.make_set(new_ids)
+
+    def find_set(self, element: str) -> str:
+        return self._labels[self._dsu.find_set(self._ids[element])]
+
+    def union_set(self, element1: str, element2: str) -> bool:
+        return self._dsu.union_set(self._ids[element1], self._ids[element2])
+
+    def get_id(self, element: str) -> int:
+        """
+        Get the integer id the element is interned to
+        """
+        return self._ids[element]
+
+    def get_union_method(self) -> UnionMethod:
+        return self._dsu.get_union_method()
+
+    def union_many(self, elements1: Iterable[str], elements2: Iterable[str]) -> int:
+        ids = self._ids
+        return self._dsu.union_many([ids[e] for e in elements1], [ids[e] for e in elements2])
+
+    def find_many(self, elements: Iterable[str]) -> List[str]:
+        ids, labels = self._ids, self._labels
+        return [labels[rep] for rep in self._dsu.find_many([ids[e] for e in elements])]
+
+    def get_representatives(self) -> Dict[str, str]:
+        """
+        Get representatives of all elements in the data structure at the moment
+        """
+        labels, find_set = self._labels, self._dsu.find_set
+        return {label: labels[find_set(i)] for i, label in enumerate(labels)}
+
+    def get_disjoint_set_count(self) -> int:
+        return self._dsu.get_disjoint_set_count()
+
+    def get_disjoint_set_size(self, element: str) -> int:
+        return self._dsu.get_disjoint_set_size(self._ids[element])
+
+    def get_largest_disjoint_set_size(self) -> int:
+        return self._dsu.get_largest_disjoint_set_size()
+
+    def __str__(self):
+        return "LabeledDisjointSetUnion@{}: {}\n-> Representatives: {}\n-> Total disjoint set count: {}".format(
+            id(self),
+            self.get_union_method(),
+            list(self.get_representatives().values()),
+            self.get_disjoint_set_count()
+        )
+
+
+if __name__ == '__main__':
+    import sys
+
+    from unionfind import DisjointSetUnion
+
+    dsu = ArrayDisjointSetUnion(union_method=UnionMethod.BY_SIZE)
+    print(dsu)
+
+    print("\nPerforming make_set {0, 1, 2, 3, 4}")
+    dsu.make_set(range(5))
+    print(dsu)
+
+    print("\nPerforming union_set {3, 2}")
+    dsu.union_set(3, 2)
+    print(dsu)
+
+    print("\nPerforming union_set {1, 0}")
+    dsu.union_set(1, 0)
+    print(dsu)
+
+    print("\nPerforming union_set {0, 2}")
+    dsu.union_set(0, 2)
+    print(dsu)
+
+    print("\nPerforming union_many {(3, 4), (0, 1)} and find_many {0, 1, 2, 3, 4}")
+    dsu.union_many([3, 0], [4, 1])
+    print(dsu.find_many([0, 1, 2, 3, 4]))
+
+    labeled_dsu = LabeledDisjointSetUnion()
+    print("\nPerforming make_set {'A', 'B', 'C', 'D', 'E'} and union_set {'A', 'B'}, {'C', 'D'} on labeled elements")
+    labeled_dsu.make_set(['A', 'B', 'C', 'D', 'E'])
+    labeled_dsu.union_set('A', 'B')
+    labeled_dsu.union_set('C', 'D')
+    print(labeled_dsu)
+
+    num_elements = 100000
+    dict_dsu = DisjointSetUnion()
+    dict_dsu.make_set(range(num_elements))  # type: ignore
+    array_dsu = ArrayDisjointSetUnion()
+    array_dsu.make_set(range(num_elements))
+    dict_bytes = sum(sys.getsizeof(d) for d in (dict_dsu._representatives, dict_dsu._ranks, dict_dsu._sizes))
+    print("\nMemory used by {} elements (bytes, excluding the elements themselves)".format(num_elements))
+    print("-> DisjointSetUnion: {}".format(dict_bytes))
+    print("-> ArrayDisjointSetUnion: {}".format(array_dsu.memory_usage()))
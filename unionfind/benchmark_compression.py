@@ -0,0 +1,69 @@
+import random
+import sys
+import time
+from typing import Dict
+
+from unionfind import CompressionMethod, DisjointSetUnion, UnionMethod
+from unionfind.array_backed import ArrayDisjointSetUnion
+
+"""
+Benchmark of the path compression methods on deep trees
+
+Union-by-rank/size keep the trees shallow, so deep trees are built directly as a single chain of parent pointers
+(0 -> 1 -> 2 -> ... -> n-1), which is what a sequence of unions without union-by-rank/size would produce. Every element
+is then looked up once in random order; the first lookups walk (and compress) long paths, later ones are short.
+
+The previous recursive `find_set` is included as a baseline: it needs one Python frame per level and raises
+`RecursionError` on chains deeper than the recursion limit.
+"""
+
+
+def _recursive_find_set(parents: Dict[int, int], element: int) -> int:
+    if parents[element] != element:
+        parents[element] = _recursive_find_set(parents, parents[element])
+    return parents[element]
+
+
+def _chain(depth: int) -> Dict[int, int]:
+    parents = {i: i + 1 for i in range(depth - 1)}
+    parents[depth - 1] = depth - 1
+    return parents
+
+
+def benchmark(depth: int, seed: int = 0) -> None:
+    queries = list(range(depth))
+    random.Random(seed).shuffle(queries)
+    print("\n=> Chain of depth {}".format(depth))
+
+    parents = _chain(depth)
+    start = time.perf_counter()
+    try:
+        for q in queries:
+            _recursive_find_set(parents, q)
+        print("-> {:<32} {:.4f}s".format("Recursive (baseline)", time.perf_counter() - start))
+    except RecursionError:
+        print("-> {:<32} RecursionError".format("Recursive (baseline)"))
+
+    for compression_method in CompressionMethod:
+        dsu = DisjointSetUnion(union_method=UnionMethod.BY_SIZE, compression_method=compression_method)
+        dsu._representatives = _chain(depth)  # type: ignore
+        start = time.perf_counter()
+        for q in queries:
+            dsu.find_set(q)  # type: ignore
+        print("-> {:<32} {:.4f}s".format("DisjointSetUnion " + compression_method.name, time.perf_counter() - start))
+
+    for compression_method in CompressionMethod:
+        array_dsu = ArrayDisjointSetUnion(union_method=UnionMethod.BY_SIZE, compression_method=compression_method)
+        array_dsu.make_set(range(depth))
+        for i in range(depth - 1):
+            array_dsu._parents[i] = i + 1
+        start = time.perf_counter()
+        for q in queries:
+            array_dsu.find_set(q)
+        print("-> {:<32} {:.4f}s".format("ArrayDisjointSetUnion " + compression_method.name, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    print("Recursion limit: {}".format(sys.getrecursionlimit()))
+    for depth in (500, 10000, 1000000):
+        benchmark(depth)
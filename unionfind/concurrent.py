@@ -0,0 +1,171 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Sequence, Tuple
+
+from unionfind import DisjointSetUnion, UnionMethod
+
+
+class ConcurrentDisjointSetUnion:
+    """
+    Thread-safe Disjoint Set Union (union-by-size) for multiple threads performing unions concurrently
+
+    Wrapping every call of `DisjointSetUnion` in one global lock serializes all threads, even the ones only finding
+    representatives. Here:
+    - `find_set` never takes a lock. It performs path halving without synchronization, which is safe because a parent
+      pointer is only ever replaced by one of its ancestors in the same tree: a racing thread can at worst undo another
+      thread's compression (a benign race), never break the tree.
+    - `union_set` only locks the two representatives being linked, using a fixed pool of striped locks (a representative
+      maps to lock `hash(rep) % num_stripes`). Both stripes are acquired in index order to avoid deadlocks. As another
+      thread may have linked either representative in the meantime, both are re-validated as roots under the locks and
+      the union is retried if not. Unions of unrelated sets proceed in parallel
+    - `make_set` takes a lock only to keep the set count consistent
+
+    NOTE: In CPython, the GIL still runs Python bytecode of one thread at a time, so this removes lock contention but
+    does not make unions CPU-parallel; for CPU-bound bulk unions, see `union_find_sharded` which uses processes
+    """
+    def __init__(self, num_stripes: int = 64):
+        self._disjoint_set_count = 0
+        self._representatives: Dict[str, str] = {}
+        self._sizes: Dict[str, int] = {}
+        self._stripes = [threading.Lock() for _ in range(num_stripes)]
+        self._count_lock = threading.Lock()
+
+    def make_set(self, elements: Iterable[str]) -> None:
+        for e in elements:
+            if e not in self._representatives:
+                with self._count_lock:
+                    if e not in self._representatives:
+                        self._sizes[e] = 1
+                        self._representatives[e] = e
+                        self._disjoint_set_count += 1
+
+    def find_set(self, element: str) -> str:
+        parents = self._representatives
+        parent = parents[element]
+        while parent != element:
+            grandparent = parents[parent]
+            parents[element] = grandparent  # path halving, benign if it races with another thread
+            element, parent = grandparent, parents[grandparent]
+        return element
+
+    def union_set(self, element1: str, element2: str) -> bool:
+        parents, sizes = self._representatives, self._sizes
+        while True:
+            rep1 = self.find_set(element1)
+            rep2 = self.find_set(element2)
+            if rep1 == rep2:
+                return False  # sets only ever merge, so elements found in the same set stay in the same set
+
+            stripe1, stripe2 = hash(rep1) % len(self._stripes), hash(rep2) % len(self._stripes)
+            first, second = self._stripes[min(stripe1, stripe2)], self._stripes[max(stripe1, stripe2)]
+            with first:
+                if second is not first:
+                    second.acquire()
+                try:
+                    if parents[rep1] != rep1 or parents[rep2] != rep2:
+                        continue  # a representative was linked by another thread, retry with the new representatives
+                    if sizes[rep1] < sizes[rep2]:
+                        rep1, rep2 = rep2, rep1
+                    sizes[rep1] += sizes[rep2]
+                    parents[rep2] = rep1
+                finally:
+                    if second is not first:
+                        second.release()
+            with self._count_lock:
+                self._disjoint_set_count -= 1
+            return True
+
+    def get_representatives(self) -> Dict[str, str]:
+        """
+        Get representatives of all elements in the data structure at the moment
+        """
+        return {e: self.find_set(e) for e in list(self._representatives.keys())}
+
+    def get_disjoint_set_count(self) -> int:
+        """
+        Get total number of disjoint sets in the data structure at the moment
+        """
+        return self._disjoint_set_count
+
+    def get_disjoint_set_size(self, element: str) -> int:
+        """
+        Get size of the disjoint set containing the element
+        """
+        return self._sizes[self.find_set(element)]
+
+    def __str__(self):
+        return "ConcurrentDisjointSetUnion@{}\n-> Representatives: {}\n-> Total disjoint set count: {}".format(
+            id(self),
+            list(self.get_representatives().values()),
+            self.get_disjoint_set_count()
+        )
+
+
+def merge_disjoint_set_unions(representatives: Iterable[Dict[str, str]],
+                              union_method: UnionMethod = UnionMethod.BY_RANK) -> DisjointSetUnion:
+    """
+    Merge disjoint sets built independently (eg: by different shards) into a single Disjoint Set Union
+    Every input maps elements to their representative; an element present in multiple inputs joins all of its sets
+    """
+    dsu = DisjointSetUnion(union_method=union_method)
+    for reps in representatives:
+        dsu.make_set(reps.keys())
+        dsu.make_set(reps.values())
+        dsu.union_many(reps.keys(), reps.values())
+    return dsu
+
+
+def union_find_sharded(edge_shards: Sequence[Sequence[Tuple[str, str]]], processes: int = 4,
+                       union_method: UnionMethod = UnionMethod.BY_RANK) -> DisjointSetUnion:
+    """
+    Union a large set of (element, element) pairs split into shards using a pool of worker processes
+    1. Every shard is unioned independently by a worker into its own Disjoint Set Union
+    2. Workers only send back the representative of every element they have seen
+    3. The per-shard representatives are merged into the final Disjoint Set Union
+    Shards are processed in parallel without any locking; the merge step is linear in the number of distinct elements
+    per shard, which is much smaller than the number of pairs when shards are large
+    """
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        shard_representatives = list(executor.map(_union_shard, edge_shards))
+    return merge_disjoint_set_unions(shard_representatives, union_method=union_method)
+
+
+def _union_shard(edges: Sequence[Tuple[str, str]]) -> Dict[str, str]:
+    dsu = DisjointSetUnion()
+    for element1, element2 in edges:
+        dsu.make_set((element1, element2))
+        dsu.union_set(element1, element2)
+    return dsu.get_representatives()
+
+
+if __name__ == '__main__':
+    import random
+
+    elements = [str(i) for i in range(10000)]
+    pairs = [(random.choice(elements), random.choice(elements)) for _ in range(5000)]
+
+    concurrent_dsu = ConcurrentDisjointSetUnion()
+    concurrent_dsu.make_set(elements)
+    num_threads = 4
+    threads = [
+        threading.Thread(target=lambda chunk: [concurrent_dsu.union_set(e1, e2) for e1, e2 in chunk],
+                         args=(pairs[i::num_threads],))
+        for i in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reference_dsu = DisjointSetUnion()
+    reference_dsu.make_set(elements)
+    reference_dsu.union_many([e1 for e1, _ in pairs], [e2 for _, e2 in pairs])
+
+    print("\n=> Disjoint set count after {} unions from {} threads".format(len(pairs), num_threads))
+    print("-> ConcurrentDisjointSetUnion: {}".format(concurrent_dsu.get_disjoint_set_count()))
+    print("-> DisjointSetUnion: {}".format(reference_dsu.get_disjoint_set_count()))
+
+    sharded_dsu = union_find_sharded([pairs[i::num_threads] for i in range(num_threads)], processes=num_threads)
+    sharded_dsu.make_set(elements)  # elements without any pairs
+    print("\n=> Disjoint set count after {} unions from {} process shards".format(len(pairs), num_threads))
+    print("-> Sharded: {}".format(sharded_dsu.get_disjoint_set_count()))
@@ -0,0 +1,125 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class RollbackDisjointSetUnion:
+    """
+    Disjoint Set Union that can undo its operations, also called a persistent-undo or rollback Disjoint Set Union
+
+    Every change to the data structure is recorded in a change log; `snapshot()` returns the current length of the log
+    and `rollback(snapshot)` undoes changes in reverse order until the log is back to that length, i.e. in O(changes)
+    time, without rebuilding anything.
+
+    To keep every change O(1) to undo, the data structure only performs union-by-size and no path compression:
+    - a union only changes the parent of one representative and the size of another, which are easy to restore
+    - path compression would rewrite an unbounded number of parent pointers on every find
+    Union-by-size alone keeps the trees O(log(n)) deep, so find and union are O(log(n)) per operation
+    """
+    def __init__(self):
+        self._disjoint_set_count = 0
+        self._representatives: Dict[str, str] = {}
+        self._sizes: Dict[str, int] = {}
+        # change log entries: (attached representative, new representative) for a union, (element, None) for make_set
+        self._history: List[Tuple[str, Optional[str]]] = []
+
+    def make_set(self, elements: Iterable[str]) -> None:
+        for e in elements:
+            if e not in self._representatives:
+                self._representatives[e] = e
+                self._sizes[e] = 1
+                self._disjoint_set_count += 1
+                self._history.append((e, None))
+
+    def find_set(self, element: str) -> str:
+        parents = self._representatives
+        while parents[element] != element:
+            element = parents[element]
+        return element
+
+    def union_set(self, element1: str, element2: str) -> bool:
+        rep1 = self.find_set(element1)
+        rep2 = self.find_set(element2)
+
+        # elements are in the same set and have a common group representative
+        if rep1 == rep2:
+            return False  # union not performed
+
+        if self._sizes[rep1] < self._sizes[rep2]:
+            rep1, rep2 = rep2, rep1
+        self._representatives[rep2] = rep1
+        self._sizes[rep1] += self._sizes[rep2]
+        self._disjoint_set_count -= 1
+        self._history.append((rep2, rep1))
+        return True
+
+    def snapshot(self) -> int:
+        """
+        Get a snapshot of the current state that can later be restored with `rollback`
+        """
+        return len(self._history)
+
+    def rollback(self, snapshot: int) -> None:
+        """
+        Undo all changes made after the snapshot was taken, in O(number of changes undone) time
+        """
+        if not 0 <= snapshot <= len(self._history):
+            raise ValueError("Invalid snapshot: {}".format(snapshot))
+        while len(self._history) > snapshot:
+            element, rep = self._history.pop()
+            if rep is None:
+                # undo make_set
+                del self._representatives[element]
+                del self._sizes[element]
+            else:
+                # undo union: detach the attached representative again
+                self._representatives[element] = element
+                self._sizes[rep] -= self._sizes[element]
+            self._disjoint_set_count += 1 if rep is not None else -1
+
+    def get_representatives(self) -> Dict[str, str]:
+        """
+        Get representatives of all elements in the data structure at the moment
+        """
+        return {e: self.find_set(e) for e in self._representatives.keys()}
+
+    def get_disjoint_set_count(self) -> int:
+        """
+        Get total number of disjoint sets in the data structure at the moment
+        """
+        return self._disjoint_set_count
+
+    def get_disjoint_set_size(self, element: str) -> int:
+        """
+        Get size of the disjoint set containing the element
+        """
+        return self._sizes[self.find_set(element)]
+
+    def __str__(self):
+        return "RollbackDisjointSetUnion@{}\n-> Representatives: {}\n-> Total disjoint set count: {}\n-> Changes: {}".format(
+            id(self),
+            list(self.get_representatives().values()),
+            self.get_disjoint_set_count(),
+            self.snapshot()
+        )
+
+
+if __name__ == '__main__':
+    dsu = RollbackDisjointSetUnion()
+
+    print("\nPerforming make_set {'A', 'B', 'C', 'D', 'E'}")
+    dsu.make_set(['A', 'B', 'C', 'D', 'E'])
+    print(dsu)
+
+    print("\nPerforming union_set {'A', 'B'}, {'C', 'D'} and taking a snapshot")
+    dsu.union_set('A', 'B')
+    dsu.union_set('C', 'D')
+    snapshot = dsu.snapshot()
+    print(dsu)
+
+    print("\nPerforming union_set {'B', 'C'}, {'D', 'E'}")
+    dsu.union_set('B', 'C')
+    dsu.union_set('D', 'E')
+    print(dsu)
+
+    print("\nRolling back to the snapshot")
+    dsu.rollback(snapshot)
+    print(dsu)